@@ -0,0 +1,83 @@
+import argparse
+import random
+import sys
+import time
+
+from pythonProject.modules.computer_logic import computer_move
+from pythonProject.modules.difficulty import DIFFICULTIES
+from pythonProject.modules.move_table import get_table
+from pythonProject.modules.simulation import play_game, random_strategy
+
+# Move latency of every difficulty level on positions from random games. Each level's time
+# budget is its latency guarantee: the run fails if any single move takes longer.
+# Without --size both the 3x3 game and 15x15 gomoku are checked; search nodes are by far the
+# most expensive on the wide board, so that is where a bound can actually be missed.
+DEFAULT_BOARDS = ((3, 3, 300), (15, 5, 30))  # size, win length, positions
+
+
+def sample_positions(count, rows, cols, win_length, seed=0):
+
+    rng = random.Random(seed)
+    positions = []
+    while len(positions) < count:
+        _, moves = play_game(random_strategy, random_strategy, rng, rows, cols, win_length)
+        board = [[None] * cols for _ in range(rows)]
+        for ply, (row, col) in enumerate(moves[:-1]):
+            board[row][col] = 1 if ply % 2 == 0 else 2
+            if ply % 2 == 0:
+                positions.append([line[:] for line in board])
+    return positions[:count]
+
+
+def run(count=300, rows=3, cols=3, win_length=3, seed=0):
+
+    get_table()
+    positions = sample_positions(count, rows, cols, win_length, seed)
+    results = {}
+    within_bounds = True
+    for name, level in DIFFICULTIES.items():
+        rng = random.Random(seed)
+        latencies = []
+        for board in positions:
+            started = time.perf_counter()
+            computer_move(board, 2, win_length, name, rng)
+            latencies.append(time.perf_counter() - started)
+        latencies.sort()
+        worst = latencies[-1]
+        results[name] = {
+            'mean_ms': sum(latencies) / len(latencies) * 1000,
+            'p99_ms': latencies[min(len(latencies) - 1, int(0.99 * len(latencies)))] * 1000,
+            'max_ms': worst * 1000,
+            'bound_ms': level.time_budget * 1000,
+        }
+        ok = worst <= level.time_budget
+        within_bounds = within_bounds and ok
+        print(f"{name:8} mean {results[name]['mean_ms']:8.3f} ms   p99 {results[name]['p99_ms']:8.3f} ms   "
+              f"max {results[name]['max_ms']:8.3f} ms   bound {results[name]['bound_ms']:7.1f} ms   "
+              f"{'ok' if ok else 'EXCEEDED'}")
+    return results, within_bounds
+
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description="Check move latency of every AI difficulty level.")
+    parser.add_argument('--positions', type=int, default=None, help="positions per board (default: 300 on 3x3)")
+    parser.add_argument('--size', type=int, default=None, help="board rows and columns (default: 3x3 and 15x15)")
+    parser.add_argument('--win-length', type=int, default=None, help="marks in a row needed (default: --size)")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+    if args.size is None:
+        boards = DEFAULT_BOARDS
+    else:
+        boards = ((args.size, args.win_length or args.size, 300),)
+
+    within_bounds = True
+    for size, win_length, count in boards:
+        print(f"{size}x{size}, {win_length} in a row:")
+        _, ok = run(args.positions or count, size, size, win_length, args.seed)
+        within_bounds = within_bounds and ok
+    sys.exit(0 if within_bounds else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# Cold import time of each module, measured in a fresh interpreter per sample, plus the cost
+# of creating the window and font when the first screen opens.
+PACKAGE_PARENT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+REPEATS = 5
+MODULES = [
+    'pythonProject.modules.board_config',
+    'pythonProject.modules.game_logic',
+    'pythonProject.modules.computer_logic',
+    'pythonProject.modules.simulation',
+    'pythonProject.modules.draw',
+    'pythonProject.modules.menu',
+]
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+imported = time.perf_counter() - start
+display_ms = None
+if {open_display}:
+    from pythonProject.modules.display import get_display
+    start = time.perf_counter()
+    get_display()
+    display_ms = (time.perf_counter() - start) * 1000
+print(json.dumps({{'import_ms': imported * 1000, 'display_ms': display_ms, 'pygame_loaded': 'pygame' in sys.modules}}))
+"""
+
+
+def probe(module, open_display=False):
+
+    env = dict(os.environ, PYTHONPATH=PACKAGE_PARENT, SDL_VIDEODRIVER=os.environ.get('SDL_VIDEODRIVER', 'dummy'),
+               PYGAME_HIDE_SUPPORT_PROMPT='1')
+    output = subprocess.run([sys.executable, '-c', _PROBE.format(module=module, open_display=open_display)],
+                            env=env, capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def run():
+
+    results = {}
+    for module in MODULES:
+        samples = [probe(module) for _ in range(REPEATS)]
+        import_ms = statistics.median(sample['import_ms'] for sample in samples)
+        results[module] = {'import_ms': import_ms, 'pygame_loaded': samples[0]['pygame_loaded']}
+        print(f"{module:42} {import_ms:8.2f} ms   pygame loaded: {samples[0]['pygame_loaded']}")
+
+    samples = [probe('pythonProject.modules.menu', open_display=True) for _ in range(REPEATS)]
+    display_ms = statistics.median(sample['display_ms'] for sample in samples)
+    results['first_screen'] = {'display_ms': display_ms}
+    print(f"{'first screen (window + font)':42} {display_ms:8.2f} ms")
+    return results
+
+
+if __name__ == "__main__":
+    run()
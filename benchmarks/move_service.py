@@ -0,0 +1,80 @@
+import argparse
+import asyncio
+import random
+import time
+
+from pythonProject.modules.bitboard import Bitboard
+from pythonProject.modules.computer_logic import computer_move
+from pythonProject.modules.move_service import MoveService
+from pythonProject.modules.move_table import get_table, side_to_move
+from pythonProject.modules.simulation import play_game, random_strategy
+
+# Throughput of the move service on a realistic request mix: positions from random games,
+# so openings repeat far more often than late positions, as they do with real clients.
+
+
+def sample_requests(count, seed=0):
+
+    rng = random.Random(seed)
+    requests = []
+    while len(requests) < count:
+        _, moves = play_game(random_strategy, random_strategy, rng)
+        board = Bitboard()
+        for ply, (row, col) in enumerate(moves[:-1]):
+            board.set(row, col, 1 if ply % 2 == 0 else 2)
+            requests.append((board.copy(), side_to_move(board)))
+    return requests[:count]
+
+
+def timed(label, count, function):
+
+    started = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - started
+    print(f"{label:36} {count / elapsed:12.0f} requests/s")
+    return count / elapsed
+
+
+async def request_concurrently(service, requests):
+
+    await asyncio.gather(*(service.request_move(board, player) for board, player in requests))
+
+
+def run(count=100000, seed=0):
+
+    get_table()
+    requests = sample_requests(count, seed)
+    results = {'direct': timed("computer_move per request", count,
+                               lambda: [computer_move(board, player) for board, player in requests])}
+
+    cold = MoveService()
+    results['cold'] = timed("service, cold cache", count,
+                            lambda: [cold.get_move(board, player) for board, player in requests])
+
+    warm = MoveService()
+    warm.warm_from_table()
+    results['warm'] = timed("service, warmed from table", count,
+                            lambda: [warm.get_move(board, player) for board, player in requests])
+
+    batched = MoveService()
+    results['async'] = timed("service, concurrent async requests", count,
+                             lambda: asyncio.run(request_concurrently(batched, requests)))
+
+    for name, service in (('cold', cold), ('warm', warm), ('async', batched)):
+        stats = service.stats()
+        hit_rate = stats['hits'] / max(1, stats['hits'] + stats['misses'])
+        print(f"{name:6} hit rate {hit_rate:6.1%}, deduplicated {stats['deduplicated']}, batches {stats['batches']}")
+    return results
+
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description="Benchmark the AI move service.")
+    parser.add_argument('--requests', type=int, default=100000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+    run(args.requests, args.seed)
+
+
+if __name__ == "__main__":
+    main()
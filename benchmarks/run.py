@@ -0,0 +1,228 @@
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import pygame
+
+from pythonProject.benchmarks.import_time import probe
+from pythonProject.modules.bitboard import Bitboard
+from pythonProject.modules.computer_logic import computer_move, find_best_move, find_best_move_alphabeta, \
+    TranspositionTable
+from pythonProject.modules.constants import APP_WIDTH, APP_HEIGHT
+from pythonProject.modules.draw import draw_figures
+from pythonProject.modules.game_logic import check_win
+from pythonProject.modules.menu import draw_main_menu
+from pythonProject.modules.move_table import get_table
+from pythonProject.modules.roasts_logic import draw_roasts_frame, roasts_layout
+from pythonProject.modules.simulation import run_batch, play_game, ai_strategy, random_strategy
+
+# Headless benchmark suite. Every metric is written to a JSON file and, when a baseline file
+# exists, compared against it; a metric that got worse by more than the tolerance fails the run.
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+RESULTS_PATH = os.path.join(BENCHMARK_DIR, 'results.json')
+BASELINE_PATH = os.path.join(BENCHMARK_DIR, 'baseline.json')
+TOLERANCE = 0.25
+SEED = 0
+# Timings are the best median of a few rounds, which keeps run-to-run noise well under the tolerance
+ROUNDS = 3
+
+
+def median_ms(function, arguments):
+
+    medians = []
+    for _ in range(ROUNDS):
+        samples = []
+        for args in arguments:
+            start = time.perf_counter()
+            function(*args)
+            samples.append(time.perf_counter() - start)
+        medians.append(statistics.median(samples))
+    return min(medians) * 1000
+
+
+def mid_game_positions(count, min_marks=3, seed=SEED):
+
+    # O to move, after at least min_marks moves of a random game that is not over yet
+    rng = random.Random(seed)
+    positions = []
+    while len(positions) < count:
+        _, moves = play_game(random_strategy, random_strategy, rng)
+        board = Bitboard()
+        for ply, (row, col) in enumerate(moves[:-1]):
+            board.set(row, col, 1 if ply % 2 == 0 else 2)
+            if ply % 2 == 0 and ply + 1 >= min_marks:
+                positions.append(board.copy())
+    return positions[:count]
+
+
+def first_move_positions():
+
+    # Every opening move of X, with O to reply
+    positions = []
+    for cell in range(9):
+        board = Bitboard()
+        board.set(cell // 3, cell % 3, 1)
+        positions.append(board)
+    return positions
+
+
+def bench_ai(metrics):
+
+    get_table()
+    openings = first_move_positions()
+    middles = mid_game_positions(200)
+    metrics['ai_first_move_ms'] = (median_ms(computer_move, [(board,) for board in openings * 20]), 'lower')
+    metrics['ai_mid_game_ms'] = (median_ms(computer_move, [(board,) for board in middles]), 'lower')
+    # The search alone, with an empty transposition table each time, as without the move table
+    metrics['search_first_move_ms'] = (
+        median_ms(lambda board: find_best_move_alphabeta(board, TranspositionTable()), [(b,) for b in openings]),
+        'lower')
+    metrics['search_mid_game_ms'] = (
+        median_ms(lambda board: find_best_move_alphabeta(board, TranspositionTable()), [(b,) for b in middles]),
+        'lower')
+    later = mid_game_positions(40, min_marks=5)
+    metrics['minimax_late_game_ms'] = (median_ms(lambda board: find_best_move(board.to_rows()),
+                                                 [(board,) for board in later]), 'lower')
+
+
+def best_rate(function, count):
+
+    # Operations per second of the fastest of ROUNDS runs of function, which does count operations
+    fastest = None
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        fastest = elapsed if fastest is None else min(fastest, elapsed)
+    return count / fastest
+
+
+def check_all(boards, repeats):
+
+    for _ in range(repeats):
+        for board in boards:
+            check_win(board, 1)
+            check_win(board, 2)
+
+
+def bench_win_checks(metrics):
+
+    rng = random.Random(SEED)
+    boards = [Bitboard(x, o) for x, o in ((rng.getrandbits(9), rng.getrandbits(9)) for _ in range(2000))]
+    rows = [board.to_rows() for board in boards[:500]]
+    repeats = 30
+    metrics['win_checks_per_second'] = (
+        best_rate(lambda: check_all(boards, repeats), repeats * len(boards) * 2), 'higher')
+    metrics['list_win_checks_per_second'] = (
+        best_rate(lambda: check_all(rows, repeats), repeats * len(rows) * 2), 'higher')
+
+
+def bench_simulation(metrics):
+
+    games = 2000
+    metrics['simulation_games_per_second'] = (
+        best_rate(lambda: run_batch(games, random_strategy, ai_strategy, SEED), games), 'higher')
+
+
+def bench_rendering(metrics):
+
+    draw_main_menu()
+    padding = 20
+    _, _, total_height = roasts_layout(APP_WIDTH - 2 * padding, 5, 40)
+    button = pygame.Rect(padding, APP_HEIGHT - 60, APP_WIDTH - 2 * padding, 50)
+    scroll_positions = [(-offset, button) for offset in range(0, max(1, total_height - APP_HEIGHT), 5)]
+    draw_roasts_frame(0, button)
+    metrics['roast_frame_ms'] = (median_ms(draw_roasts_frame, scroll_positions), 'lower')
+
+    full_board = [[1, 2, 1], [2, 1, 2], [2, 1, 2]]
+    metrics['draw_figures_ms'] = (median_ms(draw_figures, [(full_board,)] * 200), 'lower')
+    metrics['main_menu_open_ms'] = (median_ms(draw_main_menu, [()] * 200), 'lower')
+
+
+def bench_imports(metrics):
+
+    for module in ('pythonProject.modules.computer_logic', 'pythonProject.modules.menu'):
+        samples = [probe(module)['import_ms'] for _ in range(5)]
+        metrics[f"import_{module.rsplit('.', 1)[1]}_ms"] = (statistics.median(samples), 'lower')
+    samples = [probe('pythonProject.modules.menu', open_display=True)['display_ms'] for _ in range(5)]
+    metrics['first_screen_ms'] = (statistics.median(samples), 'lower')
+
+
+SUITES = {
+    'ai': bench_ai,
+    'win_checks': bench_win_checks,
+    'simulation': bench_simulation,
+    'rendering': bench_rendering,
+    'imports': bench_imports,
+}
+
+
+def run(suites=None):
+
+    metrics = {}
+    for name in suites or SUITES:
+        SUITES[name](metrics)
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'timestamp': time.time(),
+        'metrics': {name: {'value': value, 'better': better} for name, (value, better) in metrics.items()},
+    }
+
+
+def compare(results, baseline, tolerance=TOLERANCE):
+
+    # Returns the metrics that got worse by more than tolerance (as a fraction of the baseline)
+    regressions = []
+    for name, metric in results['metrics'].items():
+        old = baseline['metrics'].get(name)
+        if old is None or not old['value']:
+            print(f"{name:32} {metric['value']:14.3f}   (no baseline)")
+            continue
+        change = metric['value'] / old['value'] - 1
+        worse = -change if metric['better'] == 'higher' else change
+        status = 'REGRESSED' if worse > tolerance else 'ok'
+        if worse > tolerance:
+            regressions.append(name)
+        print(f"{name:32} {metric['value']:14.3f}   baseline {old['value']:14.3f}   {change:+7.1%}   {status}")
+    return regressions
+
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description="Run the headless benchmark suite.")
+    parser.add_argument('--suite', action='append', choices=sorted(SUITES), help="run only these suites")
+    parser.add_argument('--output', default=RESULTS_PATH, help="where to write the JSON results")
+    parser.add_argument('--baseline', default=BASELINE_PATH, help="results to compare against")
+    parser.add_argument('--save-baseline', action='store_true', help="store these results as the new baseline")
+    parser.add_argument('--tolerance', type=float, default=TOLERANCE, help="allowed slowdown, e.g. 0.25 for 25%%")
+    args = parser.parse_args(argv)
+
+    results = run(args.suite)
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+
+    regressions = []
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+    else:
+        for name, metric in results['metrics'].items():
+            print(f"{name:32} {metric['value']:14.3f}")
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f"Saved baseline to {args.baseline}")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+import os
+import statistics
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pythonProject.modules.menu as menu
+import pythonProject.modules.messages as messages
+from pythonProject.modules.widgets import clear_widget_cache
+
+# Screen-open latency with cold caches (every label rendered and every layout computed,
+# as each open did before the widget cache) against warm caches (a few blits).
+REPEATS = 200
+
+
+def reset_caches():
+
+    clear_widget_cache()
+    menu._menu_layouts.clear()
+    messages._game_over_layout = None
+
+
+def time_open(draw, cold):
+
+    samples = []
+    for _ in range(REPEATS):
+        if cold:
+            reset_caches()
+        start = time.perf_counter()
+        draw()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def run():
+
+    screens = {
+        'main_menu': menu.draw_main_menu,
+        'game_over': lambda: messages.draw_game_over_screen('X'),
+        'secret_unlocked': messages.display_secret_unlocked,
+    }
+    results = {}
+    for name, draw in screens.items():
+        cold = time_open(draw, cold=True)
+        warm = time_open(draw, cold=False)
+        results[name] = {'cold_ms': cold, 'warm_ms': warm}
+        print(f"{name:16} cold {cold:7.3f} ms   warm {warm:7.3f} ms   speedup {cold / warm:5.1f}x")
+    return results
+
+
+if __name__ == "__main__":
+    run()
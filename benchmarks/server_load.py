@@ -0,0 +1,104 @@
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+
+from pythonProject.modules.game_server import GameServer, DEFAULT_PORT
+
+# Opens many concurrent connections, each playing random moves against the server AI, and reports
+# the time from sending a move to receiving the reply that hands the turn back (or ends the game).
+
+
+async def read_message(reader):
+
+    line = await reader.readline()
+    if not line:
+        raise ConnectionError("server closed the connection")
+    return json.loads(line)
+
+
+async def play_client(host, port, games, rng, latencies):
+
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for _ in range(games):
+            writer.write(b'{"type":"new","mode":"computer"}\n')
+            message = await read_message(reader)
+            while message['type'] != 'state':
+                message = await read_message(reader)
+
+            while True:
+                empty = [cell for cell, mark in enumerate(message['board']) if mark == '.']
+                cell = rng.choice(empty)
+                started = time.perf_counter()
+                writer.write(json.dumps({'type': 'move', 'row': cell // 3, 'col': cell % 3}).encode() + b'\n')
+                while True:
+                    message = await read_message(reader)
+                    if message['type'] == 'over' or (message['type'] == 'state' and message['turn'] == 1):
+                        break
+                    if message['type'] == 'error':
+                        raise RuntimeError(message['message'])
+                latencies.append(time.perf_counter() - started)
+                if message['type'] == 'over':
+                    break
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+def percentile(samples, fraction):
+
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def run(clients=1000, games=3, host='127.0.0.1', port=DEFAULT_PORT, seed=0, local_server=True):
+
+    game_server = tcp_server = None
+    if local_server:
+        game_server = GameServer()
+        tcp_server = await game_server.start(host, port)
+    latencies = []
+    started = time.perf_counter()
+    try:
+        await asyncio.gather(*(play_client(host, port, games, random.Random(seed + index), latencies)
+                               for index in range(clients)))
+    finally:
+        if tcp_server is not None:
+            tcp_server.close()
+            await tcp_server.wait_closed()
+            while game_server.connections:
+                await asyncio.sleep(0.01)
+            game_server.executor.shutdown()
+    elapsed = time.perf_counter() - started
+
+    results = {
+        'clients': clients,
+        'moves': len(latencies),
+        'moves_per_second': len(latencies) / elapsed,
+        'p50_ms': percentile(latencies, 0.50) * 1000,
+        'p99_ms': percentile(latencies, 0.99) * 1000,
+        'mean_ms': statistics.fmean(latencies) * 1000,
+    }
+    print(f"{clients} clients, {len(latencies)} moves in {elapsed:.2f}s ({results['moves_per_second']:.0f} moves/s)")
+    print(f"move latency p50 {results['p50_ms']:.2f} ms, p99 {results['p99_ms']:.2f} ms")
+    return results
+
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description="Load-test the Tic Tac Toe game server.")
+    parser.add_argument('--clients', type=int, default=1000)
+    parser.add_argument('--games', type=int, default=3, help="games per client")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--remote', action='store_true', help="use an already running server instead of starting one")
+    args = parser.parse_args(argv)
+    asyncio.run(run(args.clients, args.games, args.host, args.port, args.seed, not args.remote))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+import random
+from functools import lru_cache
+
+from pythonProject.modules.board_config import *
+from pythonProject.modules.bitboard import Bitboard
+
+# Directions of the four line types through a cell: horizontal, vertical and both diagonals
+LINE_DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+# Heuristic weight of an open window (no opponent marks) holding n of the player's marks
+WINDOW_WEIGHTS = [0] + [10 ** n for n in range(1, 12)]
+ZOBRIST_SEED = 0x7A3
+
+
+@lru_cache(maxsize=None)
+def board_geometry(rows, cols, win_length):
+
+    # Every run of win_length cells is a window; each cell lists the windows it belongs to
+    windows = []
+    for row in range(rows):
+        for col in range(cols):
+            for d_row, d_col in LINE_DIRECTIONS:
+                end_row = row + d_row * (win_length - 1)
+                end_col = col + d_col * (win_length - 1)
+                if 0 <= end_row < rows and 0 <= end_col < cols:
+                    windows.append(tuple((row + d_row * i) * cols + col + d_col * i for i in range(win_length)))
+    cell_windows = [[] for _ in range(rows * cols)]
+    for index, window in enumerate(windows):
+        for cell in window:
+            cell_windows[cell].append(index)
+
+    neighbours = []
+    for cell in range(rows * cols):
+        row, col = divmod(cell, cols)
+        neighbours.append(tuple(r * cols + c
+                                for r in range(max(0, row - 1), min(rows, row + 2))
+                                for c in range(max(0, col - 1), min(cols, col + 2))
+                                if (r, c) != (row, col)))
+    return tuple(windows), tuple(tuple(w) for w in cell_windows), tuple(neighbours)
+
+
+@lru_cache(maxsize=None)
+def zobrist_keys(rows, cols):
+
+    # One random 64-bit number per cell and player; a position's key is the XOR of its marks.
+    # Seeded, so every process computes the same keys for the shared transposition table.
+    rng = random.Random(ZOBRIST_SEED * 1000003 + rows * 1009 + cols)
+    return (None,
+            tuple(rng.getrandbits(64) for _ in range(rows * cols)),
+            tuple(rng.getrandbits(64) for _ in range(rows * cols)))
+
+
+class Position:
+    # A board that is changed only through push and pop. Each move updates the mark counts of the
+    # windows through its cell, so the winner, a full board and the heuristic score are always
+    # known without rescanning, and all lists are allocated once up front.
+    __slots__ = ('rows', 'cols', 'win_length', 'cells', 'counts', 'score', 'near', 'stack', 'move_count',
+                 'winner', 'winner_ply', 'cell_windows', 'neighbours', 'key', 'zobrist')
+
+    def __init__(self, rows=BOARD_ROWS, cols=BOARD_COLS, win_length=WIN_LENGTH):
+        windows, self.cell_windows, self.neighbours = board_geometry(rows, cols, win_length)
+        self.rows = rows
+        self.cols = cols
+        self.win_length = win_length
+        self.cells = [0] * (rows * cols)
+        self.counts = [None, [0] * len(windows), [0] * len(windows)]
+        self.score = 0  # open-window value from O's point of view
+        self.near = [0] * (rows * cols)  # occupied neighbours of each cell
+        self.stack = [0] * (rows * cols)  # cells in the order they were played
+        self.move_count = 0
+        self.winner = None
+        self.winner_ply = 0
+        self.key = 0  # Zobrist hash of the marks
+        self.zobrist = zobrist_keys(rows, cols)
+
+    @classmethod
+    def from_board(cls, board, win_length=WIN_LENGTH):
+        # Bitboards and row lists are played in cell order; a Position is copied
+        if isinstance(board, Position):
+            return board.copy()
+        if isinstance(board, Bitboard):
+            board = board.to_rows()
+        position = cls(len(board), len(board[0]), win_length)
+        for row in range(position.rows):
+            for col in range(position.cols):
+                if board[row][col] is not None:
+                    position.push(row * position.cols + col, board[row][col])
+        # Pushing in cell order says nothing about who won first; X is checked first, like check_win callers do
+        for player in (1, 2):
+            if position.win_length in position.counts[player]:
+                position.winner = player
+                position.winner_ply = position.move_count
+                break
+        return position
+
+    def copy(self):
+        position = Position(self.rows, self.cols, self.win_length)
+        for ply in range(self.move_count):
+            cell = self.stack[ply]
+            position.push(cell, self.cells[cell])
+        return position
+
+    def push(self, cell, player):
+        # Plays player's mark on cell; returns True if it completes a window
+        counts, other = self.counts[player], self.counts[3 - player]
+        sign = 1 if player == 2 else -1
+        won = False
+        for window in self.cell_windows[cell]:
+            mine = counts[window]
+            if other[window] == 0:
+                self.score += sign * (WINDOW_WEIGHTS[mine + 1] - WINDOW_WEIGHTS[mine])
+                if mine + 1 == self.win_length:
+                    won = True
+            elif mine == 0:
+                self.score += sign * WINDOW_WEIGHTS[other[window]]
+            counts[window] = mine + 1
+        self.cells[cell] = player
+        self.key ^= self.zobrist[player][cell]
+        self.stack[self.move_count] = cell
+        self.move_count += 1
+        for neighbour in self.neighbours[cell]:
+            self.near[neighbour] += 1
+        if won and self.winner is None:
+            self.winner = player
+            self.winner_ply = self.move_count
+        return won
+
+    def pop(self):
+        # Takes back the last move and returns its cell
+        if self.winner_ply == self.move_count:
+            self.winner = None
+            self.winner_ply = 0
+        self.move_count -= 1
+        cell = self.stack[self.move_count]
+        player = self.cells[cell]
+        counts, other = self.counts[player], self.counts[3 - player]
+        sign = 1 if player == 2 else -1
+        for window in self.cell_windows[cell]:
+            mine = counts[window] - 1
+            counts[window] = mine
+            if other[window] == 0:
+                self.score -= sign * (WINDOW_WEIGHTS[mine + 1] - WINDOW_WEIGHTS[mine])
+            elif mine == 0:
+                self.score -= sign * WINDOW_WEIGHTS[other[window]]
+        self.cells[cell] = 0
+        self.key ^= self.zobrist[player][cell]
+        for neighbour in self.neighbours[cell]:
+            self.near[neighbour] -= 1
+        return cell
+
+    def push_at(self, row, col, player):
+        return self.push(row * self.cols + col, player)
+
+    def get(self, row, col):
+        return self.cells[row * self.cols + col] or None
+
+    @property
+    def last_move(self):
+        if not self.move_count:
+            return None
+        return divmod(self.stack[self.move_count - 1], self.cols)
+
+    def is_full(self):
+        return self.move_count == len(self.cells)
+
+    def is_draw(self):
+        return self.winner is None and self.move_count == len(self.cells)
+
+    def is_over(self):
+        return self.winner is not None or self.move_count == len(self.cells)
+
+    def has_won(self, player):
+        return self.winner == player
+
+    def move_list(self):
+        return [divmod(self.stack[ply], self.cols) for ply in range(self.move_count)]
+
+    def to_rows(self):
+        return [[self.cells[row * self.cols + col] or None for col in range(self.cols)] for row in range(self.rows)]
+
+    def to_board(self):
+        # The representation the AI entry points expect: a Bitboard for 3x3, rows otherwise
+        if self.rows == self.cols == self.win_length == 3:
+            return Bitboard.from_rows(self.to_rows())
+        return self.to_rows()
+
+    def move_priority(self, cell, player):
+        # Attack plus defence value of the open windows through the cell
+        counts, other = self.counts[player], self.counts[3 - player]
+        priority = 0
+        for window in self.cell_windows[cell]:
+            if other[window] == 0:
+                priority += WINDOW_WEIGHTS[counts[window] + 1]
+            if counts[window] == 0:
+                priority += WINDOW_WEIGHTS[other[window] + 1]
+        return priority
@@ -0,0 +1,101 @@
+import threading
+
+import pygame
+
+from pythonProject.modules.board_config import *
+from pythonProject.modules.computer_logic import computer_move
+from pythonProject.modules.difficulty import DIFFICULTIES
+from pythonProject.modules.nk_search import candidate_moves, stop_search
+
+# Computer moves are searched on a background thread, so the window keeps handling events while
+# the AI thinks. A finished move is announced with AI_MOVE_READY, which wakes the event loop.
+AI_MOVE_READY = pygame.USEREVENT + 1
+# Human replies searched ahead while the human thinks, the most promising first
+THINK_AHEAD_MOVES = 3
+
+
+def can_think_ahead(difficulty=AI_DIFFICULTY, backend=AI_BACKEND):
+
+    # Blunders draw from a shared generator and MCTS keeps its tree between moves, so searching
+    # extra positions would change the moves actually played; only the plain search is pure
+    return backend == 'search' and not DIFFICULTIES[difficulty].blunder_rate
+
+
+class AIWorker:
+
+    def __init__(self, think_ahead=AI_THINK_AHEAD):
+        self.think_ahead_enabled = think_ahead and can_think_ahead()
+        self.condition = threading.Condition()
+        self.wanted = None  # cells of the position the game is waiting on
+        self.jobs = []  # (cells, position) still to search, the wanted one first
+        self.running = None  # cells of the position being searched
+        self.results = {}
+        self.thread = threading.Thread(target=self.run, name='ai-worker', daemon=True)
+        self.thread.start()
+
+    def run(self):
+        while True:
+            with self.condition:
+                while not self.jobs:
+                    self.condition.wait()
+                key, position = self.jobs.pop(0)
+                self.running = key
+                stop_search.clear()
+            move = computer_move(position, 2, position.win_length)
+            with self.condition:
+                self.running = None
+                # A cancelled search is stopped early and its move is not worth keeping
+                if stop_search.is_set():
+                    if key == self.wanted:
+                        self.jobs.insert(0, (key, position))
+                    continue
+                self.results[key] = move
+                if key == self.wanted:
+                    pygame.event.post(pygame.event.Event(AI_MOVE_READY))
+
+    def request_move(self, position):
+        # Starts searching the computer's reply to position, unless it was already searched ahead
+        key = tuple(position.cells)
+        with self.condition:
+            self.wanted = key
+            self.jobs = [job for job in self.jobs if job[0] == key]
+            if key in self.results:
+                pygame.event.post(pygame.event.Event(AI_MOVE_READY))
+            elif self.running != key:
+                if self.running is not None:
+                    stop_search.set()
+                if not self.jobs:
+                    self.jobs.append((key, position.copy()))
+                self.condition.notify()
+
+    def poll(self):
+        # The requested move once it is ready, otherwise None
+        with self.condition:
+            move = self.results.get(self.wanted)
+            if move is not None:
+                self.wanted = None
+                self.results.clear()
+            return move
+
+    def think_ahead(self, position, human=1):
+        # Queues the computer's replies to the human's likeliest moves while the human decides
+        if not self.think_ahead_enabled or position.is_over():
+            return
+        jobs = []
+        for cell in candidate_moves(position, human)[:THINK_AHEAD_MOVES]:
+            after = position.copy()
+            if after.push(cell, human) or after.is_full():
+                continue
+            jobs.append((tuple(after.cells), after))
+        with self.condition:
+            self.jobs.extend(jobs)
+            self.condition.notify()
+
+    def cancel(self):
+        # Drops every pending search and stops the running one at its next clock check
+        with self.condition:
+            self.wanted = None
+            self.jobs = []
+            self.results.clear()
+            if self.running is not None:
+                stop_search.set()
@@ -0,0 +1,60 @@
+import numpy as np
+
+from pythonProject.modules.bitboard import to_bitboard, CELLS, WIN_MASKS
+from pythonProject.modules.move_table import get_table, NO_MOVE, UNREACHABLE
+
+# Batched status of many 3x3 boards at once. Boards are rows of an (N, 9) int8 array
+# holding 0 (empty), 1 (X) or 2 (O) in row-major cell order.
+LINE_MASKS = np.array(WIN_MASKS, dtype=np.uint16)
+BIT_WEIGHTS = (1 << np.arange(CELLS)).astype(np.uint16)
+BASE3_WEIGHTS = (3 ** np.arange(CELLS)).astype(np.int32)
+
+
+def player_masks(boards):
+
+    # One 9-bit mask per board and player, built with a single matrix product each
+    x_masks = (boards == 1).astype(np.uint16) @ BIT_WEIGHTS
+    o_masks = (boards == 2).astype(np.uint16) @ BIT_WEIGHTS
+    return x_masks, o_masks
+
+
+def completes_line(masks):
+
+    # (N, 8) test of every mask against every win line, reduced to one flag per board
+    return ((masks[:, None] & LINE_MASKS) == LINE_MASKS).any(axis=1)
+
+
+def evaluate_boards(boards, with_moves=False):
+
+    # Returns winner (0 none, 1 X, 2 O) and terminal flags, plus the best move per board
+    # (row * 3 + col, or -1 when the game is over or the position is unreachable) if asked.
+    boards = np.asarray(boards, dtype=np.int8).reshape(-1, CELLS)
+    x_masks, o_masks = player_masks(boards)
+    x_won = completes_line(x_masks)
+    o_won = completes_line(o_masks)
+
+    # X is checked first, matching check_win order in the search
+    winner = np.where(x_won, 1, np.where(o_won, 2, 0)).astype(np.int8)
+    terminal = (winner != 0) | (boards != 0).all(axis=1)
+    if not with_moves:
+        return winner, terminal
+
+    table = np.frombuffer(get_table(), dtype=np.uint8)
+    entries = table[boards.astype(np.int32) @ BASE3_WEIGHTS]
+    moves = (entries & 0x0F).astype(np.int8)
+    moves[(entries == UNREACHABLE) | (moves == NO_MOVE)] = -1
+    return winner, terminal, moves
+
+
+def boards_to_array(boards):
+
+    # Converts Bitboards or list-of-lists boards into the (N, 9) int8 layout
+    array = np.zeros((len(boards), CELLS), dtype=np.int8)
+    for index, board in enumerate(boards):
+        board = to_bitboard(board)
+        for cell in range(CELLS):
+            if board.x >> cell & 1:
+                array[index, cell] = 1
+            elif board.o >> cell & 1:
+                array[index, cell] = 2
+    return array
@@ -0,0 +1,86 @@
+# Compact 3x3 board: one 9-bit mask per player, bit index = row * 3 + col
+ROWS = 3
+COLS = 3
+CELLS = ROWS * COLS
+FULL_MASK = (1 << CELLS) - 1
+CELL_BITS = tuple(1 << cell for cell in range(CELLS))
+
+WIN_MASKS = (
+    0b000000111, 0b000111000, 0b111000000,  # rows
+    0b001001001, 0b010010010, 0b100100100,  # columns
+    0b100010001, 0b001010100,               # diagonals
+)
+
+# WINNING[mask] is 1 when the mask covers any of the 8 lines, so a win test is one index
+WINNING = bytes(any(mask & line == line for line in WIN_MASKS) for mask in range(1 << CELLS))
+
+# BASE3[mask] is the base-3 weight of the mask's cells, used to index the move table
+BASE3 = tuple(sum(3 ** cell for cell in range(CELLS) if mask & CELL_BITS[cell]) for mask in range(1 << CELLS))
+
+
+class Bitboard:
+    __slots__ = ('x', 'o')
+
+    def __init__(self, x=0, o=0):
+        self.x = x
+        self.o = o
+
+    @classmethod
+    def from_rows(cls, rows):
+        board = cls()
+        for row in range(ROWS):
+            for col in range(COLS):
+                if rows[row][col] is not None:
+                    board.set(row, col, rows[row][col])
+        return board
+
+    def to_rows(self):
+        return [[self.get(row, col) for col in range(COLS)] for row in range(ROWS)]
+
+    def get(self, row, col):
+        bit = CELL_BITS[row * COLS + col]
+        if self.x & bit:
+            return 1
+        if self.o & bit:
+            return 2
+        return None
+
+    def set(self, row, col, player):
+        bit = CELL_BITS[row * COLS + col]
+        if player == 1:
+            self.x |= bit
+        else:
+            self.o |= bit
+
+    def clear(self, row, col):
+        mask = FULL_MASK ^ CELL_BITS[row * COLS + col]
+        self.x &= mask
+        self.o &= mask
+
+    def has_won(self, player):
+        return WINNING[self.x if player == 1 else self.o] == 1
+
+    def is_full(self):
+        return self.x | self.o == FULL_MASK
+
+    def index(self):
+        return BASE3[self.x] + 2 * BASE3[self.o]
+
+    def copy(self):
+        return Bitboard(self.x, self.o)
+
+    def __eq__(self, other):
+        return isinstance(other, Bitboard) and self.x == other.x and self.o == other.o
+
+    def __hash__(self):
+        return hash((self.x, self.o))
+
+    def __repr__(self):
+        return f"Bitboard(x={self.x:#011b}, o={self.o:#011b})"
+
+
+def to_bitboard(board):
+
+    if isinstance(board, Bitboard):
+        return board
+    return Bitboard.from_rows(board)
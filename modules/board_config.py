@@ -0,0 +1,22 @@
+# Board and AI settings shared by the game logic and the AI.
+# Kept free of pygame so the logic can be imported without opening a window.
+BOARD_COLS = 3
+BOARD_ROWS = 3
+WIN_LENGTH = 3  # marks in a row needed to win, e.g. 4 on 5x5 or 5 for 15x15 gomoku
+
+# Seconds the AI may think per move on boards too large to solve exactly
+AI_TIME_BUDGET = 1.0
+
+# 'easy', 'medium' or 'hard' (perfect play); see modules/difficulty.py
+AI_DIFFICULTY = 'hard'
+
+# 'search' (alpha-beta) or 'mcts' (Monte Carlo tree search, see modules/mcts.py)
+AI_BACKEND = 'search'
+MCTS_PLAYOUTS = None  # playout limit per move, on top of the difficulty's time budget
+MCTS_WORKERS = 1  # processes running independent trees (root parallelization)
+
+# Processes sharing the alpha-beta search on larger boards; 1 searches in this process
+SEARCH_WORKERS = 1
+
+# Search the computer's replies to the human's likeliest moves while the human is thinking
+AI_THINK_AHEAD = False
@@ -1,55 +1,214 @@
+from collections import OrderedDict
 
-from pythonProject.modules.constants import *
-from pythonProject.modules.game_logic import check_win,check_draw
+from pythonProject.modules.board_config import *
+from pythonProject.modules.bitboard import Bitboard, to_bitboard, COLS, CELL_BITS, FULL_MASK, WINNING
+from pythonProject.modules.symmetry import canonical_key, unique_moves
+from pythonProject.modules.difficulty import DIFFICULTIES, SEARCH_TIME_FRACTION, limited_move
+from pythonProject.modules.mcts import find_best_move_mcts
+from pythonProject.modules.instrumentation import counted, timed
+from pythonProject.models.Position import Position
 
 
-def minimax(board, depth, is_maximizing):
+@counted('search.nodes')
+def minimax(position, depth, is_maximizing):
 
-    if check_win(board, 1):
+    # The position tracks its winner and move count, so every check here is O(1)
+    if position.winner == 1:
         return -10
-    if check_win(board, 2):
+    if position.winner == 2:
         return 10
-    if check_draw(board):
+    if position.is_full():
         return 0
 
+    cells = position.cells
     if is_maximizing:
         best_score = -float('inf')
-        for row in range(BOARD_ROWS):
-            for col in range(BOARD_COLS):
-                if board[row][col] is None:
-                    board[row][col] = 2
-                    score = minimax(board, depth + 1, False)
-                    board[row][col] = None
-                    best_score = max(score, best_score)
+        for cell in range(len(cells)):
+            if not cells[cell]:
+                position.push(cell, 2)
+                score = minimax(position, depth + 1, False)
+                position.pop()
+                best_score = max(score, best_score)
         return best_score
     else:
         best_score = float('inf')
-        for row in range(BOARD_ROWS):
-            for col in range(BOARD_COLS):
-                if board[row][col] is None:
-                    board[row][col] = 1
-                    score = minimax(board, depth + 1, True)
-                    board[row][col] = None
-                    best_score = min(score, best_score)
+        for cell in range(len(cells)):
+            if not cells[cell]:
+                position.push(cell, 1)
+                score = minimax(position, depth + 1, True)
+                position.pop()
+                best_score = min(score, best_score)
         return best_score
 
 
 def find_best_move(board):
 
+    position = Position.from_board(board)
+    cells = position.cells
     best_move = None
     best_score = -float('inf')
-    for row in range(BOARD_ROWS):
-        for col in range(BOARD_COLS):
-            if board[row][col] is None:
-                board[row][col] = 2
-                score = minimax(board, 0, False)
-                board[row][col] = None
+    for cell in range(len(cells)):
+        if not cells[cell]:
+            position.push(cell, 2)
+            score = minimax(position, 0, False)
+            position.pop()
+            if score > best_score:
+                best_score = score
+                best_move = divmod(cell, position.cols)
+    return best_move
+
+
+# Alpha-beta search with a transposition table shared across moves and games
+TT_MAX_ENTRIES = 100000
+EXACT, LOWER_BOUND, UPPER_BOUND = 0, 1, 2
+INF = float('inf')
+
+
+class TranspositionTable:
+
+    def __init__(self, max_entries=TT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+        return entry
+
+    def store(self, key, value, flag):
+        self.entries[key] = (value, flag)
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+
+
+transposition_table = TranspositionTable()
+
+
+def board_hash(board):
+
+    # Base-3 encoding of the cells, unique for every board
+    return to_bitboard(board).index()
+
+
+@counted('search.nodes')
+def alphabeta(x, o, is_maximizing, alpha, beta, table):
+
+    # Runs directly on the two player masks: moves are bit flips, no board is built or copied.
+    # Symmetric positions share one table entry through the canonical key.
+    tt_key = canonical_key(x, o) << 1 | is_maximizing
+    entry = table.get(tt_key)
+    if entry is not None:
+        value, flag = entry
+        if flag == EXACT:
+            return value
+        if flag == LOWER_BOUND and value >= beta:
+            return value
+        if flag == UPPER_BOUND and value <= alpha:
+            return value
+
+    if WINNING[x]:
+        return -10
+    if WINNING[o]:
+        return 10
+    occupied = x | o
+    if occupied == FULL_MASK:
+        return 0
+
+    original_alpha, original_beta = alpha, beta
+    if is_maximizing:
+        best_score = -INF
+        for bit in CELL_BITS:
+            if not occupied & bit:
+                score = alphabeta(x, o | bit, False, alpha, beta, table)
                 if score > best_score:
                     best_score = score
-                    best_move = (row, col)
-    return best_move
+                    if best_score > alpha:
+                        alpha = best_score
+                        if alpha >= beta:
+                            break
+    else:
+        best_score = INF
+        for bit in CELL_BITS:
+            if not occupied & bit:
+                score = alphabeta(x | bit, o, True, alpha, beta, table)
+                if score < best_score:
+                    best_score = score
+                    if best_score < beta:
+                        beta = best_score
+                        if alpha >= beta:
+                            break
+
+    if best_score <= original_alpha:
+        flag = UPPER_BOUND
+    elif best_score >= original_beta:
+        flag = LOWER_BOUND
+    else:
+        flag = EXACT
+    table.store(tt_key, best_score, flag)
+    return best_score
+
+
+def solve_root(x, o, player, table):
+
+    # Same move choice as find_best_move: the first cell, in row-major order, with the best score
+    # for the mover. Searching each root move with the window bounded by the best score so far keeps
+    # that tie-break intact, because a move that cannot beat it is never reported as strictly better.
+    # Only one move per symmetry class is searched: the others score the same and come later in that order.
+    best_cell = None
+    best_score = -INF if player == 2 else INF
+    for cell in unique_moves(x, o):
+        if player == 2:
+            score = alphabeta(x, o | CELL_BITS[cell], False, best_score, INF, table)
+            improved = score > best_score
+        else:
+            score = alphabeta(x | CELL_BITS[cell], o, True, -INF, best_score, table)
+            improved = score < best_score
+        if improved:
+            best_score = score
+            best_cell = cell
+    return best_cell, best_score
+
+
+def find_best_move_alphabeta(board, table=None, player=2):
+
+    if table is None:
+        table = transposition_table
+
+    board = to_bitboard(board)
+    best_cell, _ = solve_root(board.x, board.o, player, table)
+    if best_cell is None:
+        return None
+    return divmod(best_cell, COLS)
+
+
+@timed('ai.computer_move')
+def computer_move(board, player=2, win_length=WIN_LENGTH, difficulty=AI_DIFFICULTY, rng=None, backend=AI_BACKEND):
+
+    if isinstance(board, Position):
+        board = board.to_board()
+    if backend == 'mcts':
+        time_budget = DIFFICULTIES[difficulty].time_budget * SEARCH_TIME_FRACTION
+        return find_best_move_mcts(board, player, win_length, time_budget, MCTS_PLAYOUTS, MCTS_WORKERS)
+    if backend != 'search':
+        raise ValueError(f"Unknown AI backend: {backend}")
 
+    # Easier levels, and every level on boards too large to solve exactly, use the bounded search.
+    # rng drives the random blunders of the easier levels (seeded by default).
+    solvable = isinstance(board, Bitboard) or (len(board) == 3 and len(board[0]) == 3 and win_length == 3)
+    if difficulty != 'hard' or not solvable:
+        return limited_move(board, player, win_length, DIFFICULTIES[difficulty], rng)
 
-def computer_move(board):
+    # Reachable positions are answered from the precomputed table, anything else is searched
+    from pythonProject.modules.move_table import lookup, side_to_move
 
-    return find_best_move(board)
\ No newline at end of file
+    board = to_bitboard(board)
+    if side_to_move(board) == player:
+        entry = lookup(board)
+        if entry is not None and entry[0] is not None:
+            return entry[0]
+    return find_best_move_alphabeta(board, player=player)
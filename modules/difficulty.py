@@ -0,0 +1,51 @@
+import random
+
+from pythonProject.modules.board_config import *
+from pythonProject.modules.bitboard import Bitboard
+from pythonProject.modules.nk_search import find_best_move_nk
+
+# Weaker levels are the same search with less compute: a depth cap, a node budget and a time
+# budget, whichever runs out first, plus a chance of playing a random move instead.
+BLUNDER_SEED = 0
+# Share of the time budget spent searching; the rest is headroom for the last node batch
+# between clock checks, so a move never takes longer than the budget
+SEARCH_TIME_FRACTION = 0.85
+
+
+class Difficulty:
+    __slots__ = ('name', 'max_depth', 'node_budget', 'time_budget', 'blunder_rate')
+
+    def __init__(self, name, max_depth, node_budget, time_budget, blunder_rate):
+        self.name = name
+        self.max_depth = max_depth
+        self.node_budget = node_budget
+        self.time_budget = time_budget  # also the guaranteed upper bound on move latency
+        self.blunder_rate = blunder_rate
+
+
+DIFFICULTIES = {
+    'easy': Difficulty('easy', max_depth=2, node_budget=300, time_budget=0.02, blunder_rate=0.25),
+    'medium': Difficulty('medium', max_depth=4, node_budget=3000, time_budget=0.1, blunder_rate=0.05),
+    # Perfect play from the move table on 3x3, the full time budget on larger boards
+    'hard': Difficulty('hard', max_depth=None, node_budget=None, time_budget=AI_TIME_BUDGET, blunder_rate=0.0),
+}
+
+blunder_rng = random.Random(BLUNDER_SEED)
+
+
+def limited_move(board, player, win_length, level, rng=None):
+
+    if rng is None:
+        rng = blunder_rng
+    rows = board.to_rows() if isinstance(board, Bitboard) else board
+    if level.blunder_rate and rng.random() < level.blunder_rate:
+        empty = [(row, col) for row in range(len(rows)) for col in range(len(rows[0])) if rows[row][col] is None]
+        if empty:
+            return rng.choice(empty)
+    if SEARCH_WORKERS > 1 and level.node_budget is None:
+        # Imported here so single-process games never load the shared-memory machinery
+        from pythonProject.modules.parallel_search import find_best_move_parallel
+        return find_best_move_parallel(rows, player, win_length, level.time_budget * SEARCH_TIME_FRACTION,
+                                       level.max_depth, SEARCH_WORKERS)
+    return find_best_move_nk(rows, player, win_length, level.time_budget * SEARCH_TIME_FRACTION, level.max_depth,
+                             level.node_budget)
@@ -0,0 +1,40 @@
+import pygame
+
+from pythonProject.modules.constants import *
+
+# The window and font are created when the first screen opens, not at import time,
+# so importing any module stays cheap and the game logic never touches SDL.
+_context = None
+
+
+class DisplayContext:
+    __slots__ = ('screen', 'font')
+
+    def __init__(self, screen, font):
+        self.screen = screen
+        self.font = font
+
+
+def get_display():
+
+    global _context
+    if _context is None:
+        pygame.init()
+        font = pygame.font.SysFont('monospace', 50)
+
+        # Set up the display
+        screen = pygame.display.set_mode((APP_WIDTH, APP_HEIGHT))
+        pygame.display.set_caption("Tic Tac Toe")
+        screen.fill(BG_COLOR)
+        _context = DisplayContext(screen, font)
+    return _context
+
+
+def get_screen():
+
+    return get_display().screen
+
+
+def get_font():
+
+    return get_display().font
@@ -1,18 +1,28 @@
+import pygame
+
 from pythonProject.modules.constants import *
+from pythonProject.modules.display import get_screen
+from pythonProject.modules.bitboard import Bitboard
+from pythonProject.modules.event_loop import clock
+from pythonProject.modules.instrumentation import OVERLAY, timed, rate
+from pythonProject.models.Position import Position
+
+# Screen areas changed since the last flush_display call
+dirty_rects = []
+_overlay_font = None
+_thinking_font = None
+
 
-# Dimensions and constants
-LINE_WIDTH = 10
-SQUARE_SIZE = 200
-CIRCLE_RADIUS = SQUARE_SIZE // 3
-CIRCLE_WIDTH = 15
-CROSS_WIDTH = 25
-OFFSET_X = 75
-OFFSET_Y = 75
-LINE_COLOR = (31, 10, 17)
+def clear_screen():
+
+    screen = get_screen()
+    screen.fill(BG_COLOR)
+    pygame.display.update()
 
 
 def draw_lines():
 
+    screen = get_screen()
     # Horizontal lines
     for row in range(1, BOARD_ROWS):
         pygame.draw.line(screen, LINE_COLOR, (OFFSET_X, OFFSET_Y + row * SQUARE_SIZE),
@@ -21,25 +31,90 @@ def draw_lines():
     for col in range(1, BOARD_COLS):
         pygame.draw.line(screen, LINE_COLOR, (OFFSET_X + col * SQUARE_SIZE, OFFSET_Y),
                          (OFFSET_X + col * SQUARE_SIZE, OFFSET_Y + GAME_HEIGHT), LINE_WIDTH)
+    mark_dirty(pygame.Rect(OFFSET_X, OFFSET_Y, GAME_WIDTH, GAME_HEIGHT))
+
+
+def cell_rect(row, col):
+
+    return pygame.Rect(OFFSET_X + col * SQUARE_SIZE, OFFSET_Y + row * SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE)
+
+
+def mark_dirty(rect):
+
+    dirty_rects.append(rect)
+
+
+@timed('render.flush_display')
+def flush_display():
 
+    if OVERLAY:
+        draw_stats_overlay()
+    # Push only the changed areas to the display instead of the whole window
+    if dirty_rects:
+        pygame.display.update(dirty_rects)
+        dirty_rects.clear()
 
+
+@timed('render.draw_mark')
+def draw_mark(row, col, player):
+
+    screen = get_screen()
+    center_x = OFFSET_X + col * SQUARE_SIZE + SQUARE_SIZE // 2
+    center_y = OFFSET_Y + row * SQUARE_SIZE + SQUARE_SIZE // 2
+
+    if player == 1:  # Player 1 (X)
+        pygame.draw.line(screen, BLUE,
+                         (center_x - CIRCLE_RADIUS, center_y - CIRCLE_RADIUS),
+                         (center_x + CIRCLE_RADIUS, center_y + CIRCLE_RADIUS),
+                         CROSS_WIDTH)
+        pygame.draw.line(screen, BLUE,
+                         (center_x - CIRCLE_RADIUS, center_y + CIRCLE_RADIUS),
+                         (center_x + CIRCLE_RADIUS, center_y - CIRCLE_RADIUS),
+                         CROSS_WIDTH)
+    elif player == 2:  # Player 2 (O)
+        pygame.draw.circle(screen, RED,
+                           (center_x, center_y),
+                           CIRCLE_RADIUS, CIRCLE_WIDTH)
+    mark_dirty(cell_rect(row, col))
+
+
+@timed('render.draw_figures')
 def draw_figures(board):
 
-    for row in range(BOARD_ROWS):
-        for col in range(BOARD_COLS):
-            center_x = OFFSET_X + col * SQUARE_SIZE + SQUARE_SIZE // 2
-            center_y = OFFSET_Y + row * SQUARE_SIZE + SQUARE_SIZE // 2
-
-            if board[row][col] == 1:  # Player 1 (X)
-                pygame.draw.line(screen, BLUE,
-                                 (center_x - CIRCLE_RADIUS, center_y - CIRCLE_RADIUS),
-                                 (center_x + CIRCLE_RADIUS, center_y + CIRCLE_RADIUS),
-                                 CROSS_WIDTH)
-                pygame.draw.line(screen, BLUE,
-                                 (center_x - CIRCLE_RADIUS, center_y + CIRCLE_RADIUS),
-                                 (center_x + CIRCLE_RADIUS, center_y - CIRCLE_RADIUS),
-                                 CROSS_WIDTH)
-            elif board[row][col] == 2:  # Player 2 (O)
-                pygame.draw.circle(screen, RED,
-                                   (center_x, center_y),
-                                   CIRCLE_RADIUS, CIRCLE_WIDTH)
+    # Full redraw of every mark; during a game draw_mark only touches the cell that changed
+    if isinstance(board, (Bitboard, Position)):
+        board = board.to_rows()
+    for row in range(len(board)):
+        for col in range(len(board[row])):
+            if board[row][col] is not None:
+                draw_mark(row, col, board[row][col])
+
+
+def draw_stats_overlay():
+
+    # Frame rate and AI search speed in the bottom-left corner, outside the board
+    global _overlay_font
+    if _overlay_font is None:
+        _overlay_font = pygame.font.SysFont('monospace', 18)
+    text = f"FPS {clock.get_fps():5.1f}  nodes/s {rate('search.nodes', 'ai.computer_move'):,.0f}"
+    surface = _overlay_font.render(text, True, WHITE, BG_COLOR)
+    rect = pygame.Rect(0, APP_HEIGHT - surface.get_height() - 4, APP_WIDTH // 2, surface.get_height() + 4)
+    screen = get_screen()
+    screen.fill(BG_COLOR, rect)
+    screen.blit(surface, (4, rect.y + 2))
+    mark_dirty(rect)
+
+
+def draw_thinking_indicator(thinking):
+
+    # "Thinking..." above the board while the computer searches; False clears it again
+    global _thinking_font
+    if _thinking_font is None:
+        _thinking_font = pygame.font.SysFont('monospace', 30)
+    surface = _thinking_font.render("Thinking...", True, WHITE)
+    rect = surface.get_rect(center=(APP_WIDTH // 2, OFFSET_Y // 2))
+    screen = get_screen()
+    screen.fill(BG_COLOR, rect)
+    if thinking:
+        screen.blit(surface, rect)
+    mark_dirty(rect)
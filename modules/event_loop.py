@@ -0,0 +1,40 @@
+import time
+
+import pygame
+
+from pythonProject.modules.constants import *
+from pythonProject.modules import instrumentation
+
+clock = pygame.time.Clock()
+_frame_started = None
+
+
+def wait_events(animating=False, fps=FPS):
+
+    global _frame_started
+    if instrumentation.ENABLED:
+        # Frame time is the work done between two waits: handling events and drawing
+        waited_at = time.perf_counter()
+        if _frame_started is not None:
+            instrumentation.record('loop.frame', waited_at - _frame_started)
+
+    # While something animates, poll at most fps times per second. Otherwise sleep in
+    # pygame.event.wait until the next event, so an idle screen uses no CPU.
+    if animating:
+        clock.tick(fps)
+        events = pygame.event.get()
+    else:
+        events = [pygame.event.wait()]
+        events.extend(pygame.event.get())
+        # Keep the frame clock current so the next animated frame isn't measured from before the wait
+        clock.tick()
+
+    # The window was uncovered or restored: push the whole surface once
+    if any(event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED) for event in events):
+        pygame.display.update()
+
+    if instrumentation.ENABLED:
+        _frame_started = time.perf_counter()
+        instrumentation.record('loop.wait', _frame_started - waited_at)
+        instrumentation.count('loop.events', len(events))
+    return events
@@ -0,0 +1,125 @@
+import io
+import math
+
+from pythonProject.modules.bitboard import CELLS, COLS
+
+# A 3x3 game is a sequence of distinct cells, i.e. a prefix of a permutation of the 9 cells.
+# Ranking every prefix (shorter games first, then in mixed-radix order) gives 986,410 codes,
+# which fit in 3 bytes per game. The outcome follows from the moves, so it is not stored.
+RECORD_SIZE = 3
+FILE_MAGIC = b'TTT1'
+CHUNK_RECORDS = 16384
+
+# LENGTH_OFFSETS[k] is the first code used by games of k moves
+LENGTH_OFFSETS = [sum(math.perm(CELLS, k) for k in range(length)) for length in range(CELLS + 2)]
+CODE_COUNT = LENGTH_OFFSETS[-1]
+
+
+def to_cells(moves):
+
+    return [move if isinstance(move, int) else move[0] * COLS + move[1] for move in moves]
+
+
+def encode_game(moves):
+
+    # Moves may be cell indices or (row, col) pairs
+    cells = to_cells(moves)
+    available = list(range(CELLS))
+    rank = 0
+    for ply, cell in enumerate(cells):
+        index = available.index(cell)
+        rank = rank * (CELLS - ply) + index
+        available.pop(index)
+    return LENGTH_OFFSETS[len(cells)] + rank
+
+
+def decode_game(code):
+
+    if not 0 <= code < CODE_COUNT:
+        raise ValueError(f"Invalid game code: {code}")
+    length = 0
+    while LENGTH_OFFSETS[length + 1] <= code:
+        length += 1
+    rank = code - LENGTH_OFFSETS[length]
+
+    indices = [0] * length
+    for ply in range(length - 1, -1, -1):
+        rank, indices[ply] = divmod(rank, CELLS - ply)
+    available = list(range(CELLS))
+    return [available.pop(index) for index in indices]
+
+
+def encode_game_bytes(moves):
+
+    return encode_game(moves).to_bytes(RECORD_SIZE, 'little')
+
+
+def decode_game_bytes(data):
+
+    return decode_game(int.from_bytes(data, 'little'))
+
+
+class GameWriter:
+
+    # Appends encoded games to a binary file: a 4-byte header, then 3 bytes per game
+
+    def __init__(self, file):
+        self._owns_file = isinstance(file, (str, bytes)) or hasattr(file, '__fspath__')
+        self.file = open(file, 'ab') if self._owns_file else file
+        if self.file.tell() == 0:
+            self.file.write(FILE_MAGIC)
+        self.buffer = bytearray()
+        self.count = 0
+
+    def write(self, moves):
+        self.buffer += encode_game_bytes(moves)
+        self.count += 1
+        if len(self.buffer) >= CHUNK_RECORDS * RECORD_SIZE:
+            self.flush()
+
+    def flush(self):
+        self.file.write(self.buffer)
+        self.buffer.clear()
+        self.file.flush()
+
+    def close(self):
+        self.flush()
+        if self._owns_file:
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def read_games(file):
+
+    # Streams decoded games (lists of cell indices) without loading the whole file
+    owns_file = isinstance(file, (str, bytes)) or hasattr(file, '__fspath__')
+    handle = open(file, 'rb') if owns_file else file
+    try:
+        if handle.read(len(FILE_MAGIC)) != FILE_MAGIC:
+            raise ValueError("Not a Tic Tac Toe game archive")
+        while True:
+            chunk = handle.read(CHUNK_RECORDS * RECORD_SIZE)
+            if not chunk:
+                return
+            if len(chunk) % RECORD_SIZE:
+                raise ValueError("Truncated game archive")
+            for offset in range(0, len(chunk), RECORD_SIZE):
+                yield decode_game(int.from_bytes(chunk[offset:offset + RECORD_SIZE], 'little'))
+    finally:
+        if owns_file:
+            handle.close()
+
+
+def encode_games(games):
+
+    # Whole archive in memory, e.g. for sending over the network
+    buffer = io.BytesIO()
+    with GameWriter(buffer) as writer:
+        for moves in games:
+            writer.write(moves)
+    return buffer.getvalue()
@@ -1,35 +1,83 @@
 
-from pythonProject.modules.constants import *
+from pythonProject.modules.board_config import *
+from pythonProject.modules.bitboard import Bitboard
+from pythonProject.modules.instrumentation import counted
+from pythonProject.models.Position import Position, LINE_DIRECTIONS
 
-def check_win(board, player):
 
-    for row in range(BOARD_ROWS):
-        if board[row][0] == board[row][1] == board[row][2] == player:
-            return True
-    for col in range(BOARD_COLS):
-        if board[0][col] == board[1][col] == board[2][col] == player:
+@counted('game.check_win')
+def check_win(board, player, win_length=WIN_LENGTH):
+
+    if isinstance(board, (Bitboard, Position)):
+        return board.has_won(player)
+
+    for row in range(len(board)):
+        for col in range(len(board[row])):
+            if board[row][col] == player and check_win_at(board, row, col, player, win_length):
+                return True
+    return False
+
+
+@counted('game.check_win_at')
+def check_win_at(board, row, col, player, win_length=WIN_LENGTH):
+
+    # Only the lines through the last move can have been completed by it
+    if isinstance(board, (Bitboard, Position)):
+        return board.has_won(player)
+
+    rows, cols = len(board), len(board[0])
+    for d_row, d_col in LINE_DIRECTIONS:
+        count = 1
+        r, c = row + d_row, col + d_col
+        while 0 <= r < rows and 0 <= c < cols and board[r][c] == player:
+            count += 1
+            r, c = r + d_row, c + d_col
+        r, c = row - d_row, col - d_col
+        while 0 <= r < rows and 0 <= c < cols and board[r][c] == player:
+            count += 1
+            r, c = r - d_row, c - d_col
+        if count >= win_length:
             return True
-    if board[0][0] == board[1][1] == board[2][2] == player:
-        return True
-    if board[0][2] == board[1][1] == board[2][0] == player:
-        return True
     return False
 
 
 def check_draw(board):
     global consecutive_draws
-    for row in range(BOARD_ROWS):
-        for col in range(BOARD_COLS):
-            if board[row][col] is None:
+    if isinstance(board, (Bitboard, Position)):
+        return board.is_full()
+    for row in board:
+        for cell in row:
+            if cell is None:
                 return False
     return True
 
 
-def reset_board():
+def cell_at(board, row, col):
 
-    return [[None for _ in range(BOARD_COLS)] for _ in range(BOARD_ROWS)]
+    if isinstance(board, (Bitboard, Position)):
+        return board.get(row, col)
+    return board[row][col]
 
-def clear_screen():
 
-    screen.fill(BG_COLOR)
-    pygame.display.update()
\ No newline at end of file
+def place_mark(board, row, col, player):
+
+    if isinstance(board, Bitboard):
+        board.set(row, col, player)
+    elif isinstance(board, Position):
+        board.push_at(row, col, player)
+    else:
+        board[row][col] = player
+
+
+def new_board(rows=BOARD_ROWS, cols=BOARD_COLS, win_length=WIN_LENGTH):
+
+    # The classic game runs on the bitboard, larger variants on a plain grid
+    if rows == cols == win_length == 3:
+        return Bitboard()
+    return [[None for _ in range(cols)] for _ in range(rows)]
+
+
+def reset_board():
+
+    # The window plays on a Position: moves are pushed, and the winner is known after each one
+    return Position(BOARD_ROWS, BOARD_COLS, WIN_LENGTH)
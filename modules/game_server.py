@@ -0,0 +1,263 @@
+import argparse
+import asyncio
+import itertools
+import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from pythonProject.modules.bitboard import Bitboard
+from pythonProject.modules.game_logic import check_win, check_draw
+from pythonProject.modules.move_service import MoveService
+from pythonProject.modules.move_table import get_table
+
+# Line-delimited JSON over TCP. Client messages:
+#   {"type": "new", "mode": "computer" | "player"}   start a match (player matches wait for an opponent)
+#   {"type": "join", "match": 12}                    join a waiting player match (omit "match" for any)
+#   {"type": "move", "row": 0, "col": 2}
+#   {"type": "best_move", "board": "X...O....", "player": 1}  ask the AI about any position
+# The server answers with "joined", "state" after every move, "over" and "error" messages.
+DEFAULT_PORT = 8765
+MAX_LINE_BYTES = 4096
+MARKS = '.XO'
+
+
+class Match:
+    __slots__ = ('id', 'mode', 'board', 'turn', 'players', 'winner', 'over')
+
+    def __init__(self, match_id, mode):
+        self.id = match_id
+        self.mode = mode
+        self.board = Bitboard()
+        self.turn = 1
+        self.players = [None, None, None]  # stream writers for X and O
+        self.winner = None
+        self.over = False
+
+
+def board_string(board):
+
+    return ''.join(MARKS[board.get(row, col) or 0] for row in range(3) for col in range(3))
+
+
+def parse_board(text):
+
+    if not isinstance(text, str) or len(text) != 9 or any(mark not in MARKS for mark in text):
+        return None
+    board = Bitboard()
+    for cell, mark in enumerate(text):
+        if mark != '.':
+            board.set(cell // 3, cell % 3, MARKS.index(mark))
+    return board
+
+
+def init_ai_worker():
+
+    get_table()
+
+
+def ai_executor(workers=None):
+
+    # Spawned rather than forked, so workers never inherit (and keep open) client sockets
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                               initializer=init_ai_worker)
+
+
+class GameServer:
+
+    def __init__(self, executor=None, move_service=None):
+        # AI moves run in worker processes so a slow search never stalls other matches
+        self.executor = executor
+        self.move_service = move_service
+        self.matches = {}
+        self.waiting = {}
+        self.match_ids = itertools.count(1)
+        self.connections = 0
+
+    async def start(self, host='127.0.0.1', port=DEFAULT_PORT):
+        if self.executor is None:
+            get_table()
+            self.executor = ai_executor()
+        if self.move_service is None:
+            self.move_service = MoveService(self.executor)
+            self.move_service.warm_from_table()
+        return await asyncio.start_server(self.handle_client, host, port, limit=MAX_LINE_BYTES)
+
+    async def handle_client(self, reader, writer):
+        self.connections += 1
+        match, player = None, None
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (asyncio.LimitOverrunError, ValueError):
+                    await send(writer, {'type': 'error', 'message': 'line too long'})
+                    break
+                if not line:
+                    break
+                try:
+                    message = json.loads(line)
+                    kind = message['type']
+                except (ValueError, KeyError, TypeError):
+                    await send(writer, {'type': 'error', 'message': 'invalid message'})
+                    continue
+
+                try:
+                    if kind in ('new', 'join'):
+                        if match is not None:
+                            self.leave(match, player)
+                            match, player = None, None
+                        match, player = await self.open_match(message, writer)
+                    elif kind == 'move' and match is not None:
+                        await self.play_move(match, player, message)
+                    elif kind == 'best_move':
+                        await self.best_move(message, writer)
+                    else:
+                        await send(writer, {'type': 'error', 'message': f'unexpected {kind!r}'})
+                except ConnectionError:
+                    raise
+                except Exception:
+                    # A message the handlers didn't anticipate gets an error reply, not a dropped connection
+                    await send(writer, {'type': 'error', 'message': 'invalid message'})
+        except ConnectionError:
+            pass
+        finally:
+            self.connections -= 1
+            if match is not None:
+                self.leave(match, player)
+            writer.close()
+
+    async def open_match(self, message, writer):
+        if message['type'] == 'join':
+            match_id = message.get('match')
+            # Ids are ints; anything else (bools included) can't name a match and may not even be hashable
+            if match_id is not None and (not isinstance(match_id, int) or isinstance(match_id, bool)):
+                await send(writer, {'type': 'error', 'message': 'invalid match'})
+                return None, None
+            if match_id is None and self.waiting:
+                match_id = next(iter(self.waiting))
+            match = self.waiting.pop(match_id, None)
+            if match is None:
+                await send(writer, {'type': 'error', 'message': 'no such match waiting'})
+                return None, None
+            match.players[2] = writer
+            await self.broadcast(match, {'type': 'joined', 'match': match.id})
+            await self.send_state(match)
+            return match, 2
+
+        mode = message.get('mode', 'computer')
+        if mode not in ('computer', 'player'):
+            await send(writer, {'type': 'error', 'message': 'unknown mode'})
+            return None, None
+        match = Match(next(self.match_ids), mode)
+        match.players[1] = writer
+        self.matches[match.id] = match
+        if mode == 'player':
+            self.waiting[match.id] = match
+            await send(writer, {'type': 'waiting', 'match': match.id})
+        else:
+            await send(writer, {'type': 'joined', 'match': match.id, 'you': 1})
+            await self.send_state(match)
+        return match, 1
+
+    async def play_move(self, match, player, message):
+        try:
+            row, col = int(message['row']), int(message['col'])
+        except (KeyError, TypeError, ValueError):
+            await send(match.players[player], {'type': 'error', 'message': 'invalid move'})
+            return
+        if match.over or match.turn != player or match.id in self.waiting:
+            await send(match.players[player], {'type': 'error', 'message': 'not your turn'})
+            return
+        if not (0 <= row < 3 and 0 <= col < 3) or match.board.get(row, col) is not None:
+            await send(match.players[player], {'type': 'error', 'message': 'illegal move'})
+            return
+
+        if await self.apply_move(match, row, col):
+            return
+        if match.mode == 'computer':
+            row, col = await self.move_service.request_move(match.board.copy(), 2)
+            if not match.over:
+                await self.apply_move(match, row, col)
+
+    async def best_move(self, message, writer):
+        board = parse_board(message.get('board'))
+        player = message.get('player', 2)
+        if board is None or player not in (1, 2):
+            await send(writer, {'type': 'error', 'message': 'invalid board'})
+            return
+        if check_win(board, 1) or check_win(board, 2) or check_draw(board):
+            await send(writer, {'type': 'error', 'message': 'game already over'})
+            return
+        row, col = await self.move_service.request_move(board, player)
+        await send(writer, {'type': 'best_move', 'row': row, 'col': col})
+
+    async def apply_move(self, match, row, col):
+        # Returns True when the move ended the game
+        player = match.turn
+        match.board.set(row, col, player)
+        if check_win(match.board, player):
+            match.winner = player
+        elif check_draw(match.board):
+            match.winner = 0
+        match.turn = 3 - player
+        await self.send_state(match, (row, col))
+        if match.winner is not None:
+            match.over = True
+            await self.broadcast(match, {'type': 'over', 'winner': match.winner})
+            self.matches.pop(match.id, None)
+            return True
+        return False
+
+    async def send_state(self, match, last_move=None):
+        await self.broadcast(match, {'type': 'state', 'match': match.id, 'board': board_string(match.board),
+                                     'turn': match.turn, 'last_move': last_move})
+
+    async def broadcast(self, match, message):
+        for player in (1, 2):
+            if match.players[player] is not None:
+                await send(match.players[player], dict(message, you=player))
+
+    def leave(self, match, player):
+        match.players[player] = None
+        self.waiting.pop(match.id, None)
+        if not match.over:
+            match.over = True
+            self.matches.pop(match.id, None)
+            opponent = match.players[3 - player]
+            if opponent is not None:
+                asyncio.ensure_future(send(opponent, {'type': 'over', 'winner': None, 'reason': 'opponent left'}))
+
+
+async def send(writer, message):
+
+    try:
+        writer.write(json.dumps(message, separators=(',', ':')).encode() + b'\n')
+        await writer.drain()
+    except ConnectionError:
+        pass
+
+
+async def serve(host, port, workers=None):
+
+    server = GameServer(ai_executor(workers))
+    tcp_server = await server.start(host, port)
+    print(f"Serving Tic Tac Toe on {host}:{port}")
+    async with tcp_server:
+        await tcp_server.serve_forever()
+
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description="Host many Tic Tac Toe matches over TCP.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--workers', type=int, default=None, help="AI worker processes (default: one per core)")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
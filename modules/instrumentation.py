@@ -0,0 +1,106 @@
+import atexit
+import functools
+import json
+import os
+import time
+
+# Opt-in counters and timers for the search, rendering and event loops. Set TTT_PROFILE=1 to
+# turn them on; the decorators then wrap the hot functions. When it is off they return the
+# function unchanged, so a disabled build runs exactly the original code.
+ENABLED = os.environ.get('TTT_PROFILE', '0') not in ('', '0')
+OVERLAY = ENABLED and os.environ.get('TTT_PROFILE_OVERLAY', '1') not in ('', '0')
+STATS_PATH = os.environ.get('TTT_PROFILE_PATH', 'tictactoe_profile.json')
+
+counters = {}
+timers = {}  # name -> [calls, total seconds, longest call]
+session_started = time.perf_counter()
+
+
+def count(name, amount=1):
+
+    counters[name] = counters.get(name, 0) + amount
+
+
+def record(name, seconds):
+
+    timer = timers.get(name)
+    if timer is None:
+        timers[name] = [1, seconds, seconds]
+        return
+    timer[0] += 1
+    timer[1] += seconds
+    if seconds > timer[2]:
+        timer[2] = seconds
+
+
+def counted(name):
+
+    def decorate(function):
+        if not ENABLED:
+            return function
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            counters[name] = counters.get(name, 0) + 1
+            return function(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def timed(name):
+
+    def decorate(function):
+        if not ENABLED:
+            return function
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                record(name, time.perf_counter() - started)
+        return wrapper
+    return decorate
+
+
+def rate(counter_name, timer_name):
+
+    # Events per second of timed work, e.g. search nodes per second of thinking
+    timer = timers.get(timer_name)
+    if not timer or not timer[1]:
+        return 0.0
+    return counters.get(counter_name, 0) / timer[1]
+
+
+def snapshot():
+
+    return {
+        'session_seconds': time.perf_counter() - session_started,
+        'counters': dict(counters),
+        'timers': {name: {'calls': calls, 'total_ms': total * 1000, 'mean_ms': total / calls * 1000,
+                          'max_ms': longest * 1000}
+                   for name, (calls, total, longest) in timers.items()},
+    }
+
+
+def dump(path=None):
+
+    with open(path or STATS_PATH, 'w') as f:
+        json.dump(snapshot(), f, indent=2, sort_keys=True)
+
+
+def reset():
+
+    global session_started
+    counters.clear()
+    timers.clear()
+    session_started = time.perf_counter()
+
+
+if ENABLED:
+    import multiprocessing
+
+    # Worker processes keep their own counters; only the main process writes the session file
+    if multiprocessing.parent_process() is None:
+        atexit.register(dump)
@@ -0,0 +1,233 @@
+import atexit
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+from pythonProject.modules.board_config import *
+
+HISTORY_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'match_history.db')
+# Games are written in one transaction per batch, at the latest FLUSH_INTERVAL seconds after they finish
+BATCH_SIZE = 256
+FLUSH_INTERVAL = 2.0
+DRAW_STREAK = 'draws'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    started_at REAL NOT NULL,
+    duration REAL NOT NULL,
+    mode TEXT NOT NULL,
+    player_x TEXT NOT NULL,
+    player_o TEXT NOT NULL,
+    winner INTEGER NOT NULL,  -- 0 draw, 1 X, 2 O
+    board_size INTEGER NOT NULL,
+    moves BLOB NOT NULL       -- row * board_size + col per move: one byte, or two (big-endian) above 16x16
+);
+CREATE INDEX IF NOT EXISTS games_by_mode ON games (mode, id);
+CREATE INDEX IF NOT EXISTS games_by_outcome ON games (mode, winner, id);
+
+-- Running totals kept up to date with every batch, so leaderboards never scan the games table
+CREATE TABLE IF NOT EXISTS player_stats (
+    name TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    wins INTEGER NOT NULL DEFAULT 0,
+    losses INTEGER NOT NULL DEFAULT 0,
+    draws INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (name, mode)
+);
+CREATE INDEX IF NOT EXISTS player_stats_by_wins ON player_stats (mode, wins DESC);
+
+CREATE TABLE IF NOT EXISTS streaks (
+    name TEXT PRIMARY KEY,
+    current INTEGER NOT NULL,
+    best INTEGER NOT NULL
+);
+"""
+
+_FLUSH = object()
+_STOP = object()
+
+
+def connect(path):
+
+    connection = sqlite3.connect(path, timeout=30)
+    # WAL lets the game read leaderboards while the writer thread commits
+    connection.execute('PRAGMA journal_mode=WAL')
+    connection.execute('PRAGMA synchronous=NORMAL')
+    connection.executescript(_SCHEMA)
+    return connection
+
+
+def move_width(board_size):
+
+    # Bytes per stored move; one byte covers every cell up to 16x16
+    return 1 if board_size <= 16 else 2
+
+
+def encode_moves(moves, board_size):
+
+    width = move_width(board_size)
+    return b''.join((row * board_size + col).to_bytes(width, 'big') for row, col in moves)
+
+
+def decode_moves(data, board_size):
+
+    width = move_width(board_size)
+    return [divmod(int.from_bytes(data[i:i + width], 'big'), board_size) for i in range(0, len(data), width)]
+
+
+def win_streak_name(player):
+
+    return f'wins:{player}'
+
+
+class MatchHistory:
+
+    def __init__(self, path=HISTORY_PATH, batch_size=BATCH_SIZE, flush_interval=FLUSH_INTERVAL):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue()
+        self._connection = connect(path)
+        self._closed = False
+        self._writer = threading.Thread(target=self._write_loop, name='match-history-writer', daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def record_game(self, mode, winner, moves, started_at, duration, player_x='Player X', player_o='Player O',
+                    board_size=BOARD_COLS):
+        # Only queues the game; the writer thread does the disk work
+        encoded_moves = encode_moves(moves, board_size)
+        self._queue.put((started_at, duration, mode, player_x, player_o, winner, board_size, encoded_moves))
+
+    def flush(self):
+        done = threading.Event()
+        self._queue.put((_FLUSH, done))
+        done.wait()
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._writer.join()
+        self._connection.close()
+
+    def _write_loop(self):
+        connection = connect(self.path)
+        pending = []
+        deadline = None
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if item is None or item is _STOP or item[0] is _FLUSH:
+                if pending:
+                    self._write_batch(connection, pending)
+                    pending = []
+                deadline = None
+                if item is _STOP:
+                    connection.close()
+                    return
+                if item is not None:
+                    item[1].set()
+                continue
+
+            pending.append(item)
+            if deadline is None:
+                deadline = time.monotonic() + self.flush_interval
+            if len(pending) >= self.batch_size:
+                self._write_batch(connection, pending)
+                pending = []
+                deadline = None
+
+    def _write_batch(self, connection, games):
+        with connection:
+            connection.executemany(
+                'INSERT INTO games (started_at, duration, mode, player_x, player_o, winner, board_size, moves) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)', games)
+
+            stats = {}
+            streaks = dict((name, [current, best]) for name, current, best in
+                           connection.execute('SELECT name, current, best FROM streaks'))
+            for _, _, mode, player_x, player_o, winner, _, _ in games:
+                x_stats = stats.setdefault((player_x, mode), [0, 0, 0])
+                o_stats = stats.setdefault((player_o, mode), [0, 0, 0])
+                draw_streak = streaks.setdefault(DRAW_STREAK, [0, 0])
+                if winner == 0:
+                    x_stats[2] += 1
+                    o_stats[2] += 1
+                    draw_streak[0] += 1
+                    winner_name = None
+                    loser_names = (player_x, player_o)
+                else:
+                    winner_name, loser_name = (player_x, player_o) if winner == 1 else (player_o, player_x)
+                    stats[(winner_name, mode)][0] += 1
+                    stats[(loser_name, mode)][1] += 1
+                    # Same rule as the game loop: only a computer win ends the streak
+                    if mode == 'computer' and winner == 2:
+                        draw_streak[0] = 0
+                    loser_names = (loser_name,)
+
+                if winner_name is not None:
+                    win_streak = streaks.setdefault(win_streak_name(winner_name), [0, 0])
+                    win_streak[0] += 1
+                    win_streak[1] = max(win_streak[1], win_streak[0])
+                for name in loser_names:
+                    streaks.setdefault(win_streak_name(name), [0, 0])[0] = 0
+                draw_streak[1] = max(draw_streak[1], draw_streak[0])
+
+            connection.executemany(
+                'INSERT INTO player_stats (name, mode, wins, losses, draws) VALUES (?, ?, ?, ?, ?) '
+                'ON CONFLICT (name, mode) DO UPDATE SET wins = wins + excluded.wins, '
+                'losses = losses + excluded.losses, draws = draws + excluded.draws',
+                [(name, mode, wins, losses, draws) for (name, mode), (wins, losses, draws) in stats.items()])
+            connection.executemany(
+                'INSERT INTO streaks (name, current, best) VALUES (?, ?, ?) '
+                'ON CONFLICT (name) DO UPDATE SET current = excluded.current, best = excluded.best',
+                [(name, current, best) for name, (current, best) in streaks.items()])
+
+    # Queries read committed data; call flush() first to include games still queued
+
+    def leaderboard(self, mode=None, limit=10):
+        if mode is not None:
+            return self._connection.execute(
+                'SELECT name, wins, losses, draws FROM player_stats WHERE mode = ? ORDER BY wins DESC LIMIT ?',
+                (mode, limit)).fetchall()
+        return self._connection.execute(
+            'SELECT name, SUM(wins) AS total_wins, SUM(losses), SUM(draws) FROM player_stats '
+            'GROUP BY name ORDER BY total_wins DESC LIMIT ?', (limit,)).fetchall()
+
+    def streak(self, name):
+        row = self._connection.execute('SELECT current, best FROM streaks WHERE name = ?', (name,)).fetchone()
+        return row if row is not None else (0, 0)
+
+    def draw_streak(self):
+        return self.streak(DRAW_STREAK)
+
+    def win_streak(self, player):
+        return self.streak(win_streak_name(player))
+
+    def recent_games(self, limit=10, mode=None, winner=None):
+        query = 'SELECT id, started_at, duration, mode, player_x, player_o, winner, board_size, moves FROM games'
+        conditions, params = [], []
+        if mode is not None:
+            conditions.append('mode = ?')
+            params.append(mode)
+        if winner is not None:
+            conditions.append('winner = ?')
+            params.append(winner)
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+        query += ' ORDER BY id DESC LIMIT ?'
+        params.append(limit)
+        return self._connection.execute(query, params).fetchall()
+
+    def game_count(self):
+        # Ids are never reused or deleted, so the largest id is the count without a table scan
+        return self._connection.execute('SELECT MAX(id) FROM games').fetchone()[0] or 0
@@ -0,0 +1,215 @@
+import math
+import random
+import time
+
+from pythonProject.modules.board_config import *
+from pythonProject.modules import nk_search
+from pythonProject.modules.bitboard import Bitboard
+from pythonProject.models.Position import board_geometry
+
+# Monte Carlo tree search: UCT selection, random playouts on flat cell and window-count arrays,
+# and the subtree of the position actually reached is kept for the next move.
+UCT_EXPLORATION = 1.4
+MCTS_SEED = 0
+
+_pool = nk_search.WorkerPool()
+
+
+class Node:
+    __slots__ = ('move', 'player', 'parent', 'children', 'untried', 'visits', 'wins')
+
+    def __init__(self, move, player, parent, untried):
+        self.move = move
+        self.player = player  # the player who made move, whose point of view wins are counted from
+        self.parent = parent
+        self.children = []
+        self.untried = untried
+        self.visits = 0
+        self.wins = 0.0
+
+    def select_child(self):
+        log_visits = math.log(self.visits)
+        return max(self.children,
+                   key=lambda child: child.wins / child.visits + UCT_EXPLORATION * math.sqrt(log_visits / child.visits))
+
+
+def play(cells, counts, cell_windows, cell, player, win_length):
+
+    # Places the mark and returns True when it completes a window
+    cells[cell] = player
+    mine = counts[player]
+    won = False
+    for window in cell_windows[cell]:
+        mine[window] += 1
+        if mine[window] == win_length:
+            won = True
+    return won
+
+
+def playout(cells, counts, cell_windows, player, win_length, rng):
+
+    # Random moves until someone wins (their number) or the board is full (0)
+    empty = [cell for cell, mark in enumerate(cells) if not mark]
+    rng.shuffle(empty)
+    for cell in empty:
+        if play(cells, counts, cell_windows, cell, player, win_length):
+            return player
+        player = 3 - player
+    return 0
+
+
+def to_cells(board):
+
+    rows = board.to_rows() if isinstance(board, Bitboard) else board
+    return [mark or 0 for row in rows for mark in row], len(rows), len(rows[0])
+
+
+def window_counts(cells, windows):
+
+    counts = [None, [0] * len(windows), [0] * len(windows)]
+    for index, window in enumerate(windows):
+        for cell in window:
+            if cells[cell]:
+                counts[cells[cell]][index] += 1
+    return counts
+
+
+def search(root, cells, rows, cols, win_length, time_budget=None, playouts=None, rng=None):
+
+    # Grows the tree under root until the time or playout budget runs out, or the search is stopped
+    if rng is None:
+        rng = random.Random(MCTS_SEED)
+    windows, cell_windows, _ = board_geometry(rows, cols, win_length)
+    root_counts = window_counts(cells, windows)
+    deadline = None if time_budget is None else time.perf_counter() + time_budget
+    done = 0
+    stop = nk_search.stop_search
+    while ((playouts is None or done < playouts) and (deadline is None or time.perf_counter() < deadline)
+           and not stop.is_set()):
+        done += 1
+        node = root
+        board = cells[:]
+        counts = [None, root_counts[1][:], root_counts[2][:]]
+        winner = None
+
+        # Selection: follow UCT through fully expanded nodes
+        while not node.untried and node.children:
+            node = node.select_child()
+            if play(board, counts, cell_windows, node.move, node.player, win_length):
+                winner = node.player
+                break
+
+        # Expansion: one new child per iteration
+        if winner is None and node.untried:
+            index = rng.randrange(len(node.untried))
+            node.untried[index], node.untried[-1] = node.untried[-1], node.untried[index]
+            move = node.untried.pop()
+            player = 3 - node.player
+            if play(board, counts, cell_windows, move, player, win_length):
+                winner = player
+                untried = []
+            else:
+                untried = [cell for cell, mark in enumerate(board) if not mark]
+            child = Node(move, player, node, untried)
+            node.children.append(child)
+            node = child
+
+        if winner is None:
+            winner = playout(board, counts, cell_windows, 3 - node.player, win_length, rng)
+
+        # Backpropagation
+        while node is not None:
+            node.visits += 1
+            if winner == node.player:
+                node.wins += 1
+            elif winner == 0:
+                node.wins += 0.5
+            node = node.parent
+    return done
+
+
+def search_root(cells, rows, cols, win_length, player, time_budget, playouts, seed):
+
+    # One independent tree for root parallelization; only the root statistics travel back
+    root = Node(None, 3 - player, None, [cell for cell, mark in enumerate(cells) if not mark])
+    search(root, cells, rows, cols, win_length, time_budget, playouts, random.Random(seed))
+    return [(child.move, child.visits, child.wins) for child in root.children]
+
+
+class MCTSEngine:
+
+    def __init__(self, seed=MCTS_SEED):
+        self.rng = random.Random(seed)
+        self.root = None
+        self.root_cells = None
+        self.shape = None
+
+    def reuse_tree(self, cells, shape, player):
+        # Walks down from the previous root along the moves played since, if they are in the tree
+        if self.root is None or shape != self.shape or len(cells) != len(self.root_cells):
+            return None
+        added = []
+        for cell, (old, new) in enumerate(zip(self.root_cells, cells)):
+            if old != new:
+                if old:
+                    return None
+                added.append(cell)
+        node = self.root
+        for _ in added:
+            node = next((child for child in node.children if child.move in added and cells[child.move] == child.player),
+                        None)
+            if node is None:
+                return None
+        if node.player != 3 - player:
+            return None
+        node.parent = None
+        return node
+
+    def best_move(self, board, player=2, win_length=WIN_LENGTH, time_budget=AI_TIME_BUDGET, playouts=None,
+                  workers=1):
+        if time_budget is None and playouts is None:
+            raise ValueError("MCTS needs a time or playout budget")
+        cells, rows, cols = to_cells(board)
+        empty = [cell for cell, mark in enumerate(cells) if not mark]
+        if not empty:
+            return None
+        shape = (rows, cols, win_length)
+        root = self.reuse_tree(cells, shape, player)
+        if root is None:
+            root = Node(None, 3 - player, None, empty)
+
+        futures = []
+        if workers > 1:
+            pool = _pool.get(workers - 1)
+            worker_playouts = None if playouts is None else playouts // workers
+            futures = [pool.submit(search_root, cells, rows, cols, win_length, player, time_budget, worker_playouts,
+                                   self.rng.getrandbits(32)) for _ in range(workers - 1)]
+            playouts = None if playouts is None else playouts - worker_playouts * (workers - 1)
+        search(root, cells, rows, cols, win_length, time_budget, playouts, self.rng)
+        if futures and not _pool.wait(futures):
+            futures = []
+
+        # The most visited move is the most robust choice; worker trees add their root visits
+        visits = {child.move: child.visits for child in root.children}
+        for future in futures:
+            for move, child_visits, _ in future.result():
+                visits[move] = visits.get(move, 0) + child_visits
+        best = max(visits, key=visits.get) if visits else empty[0]
+
+        # Keep the chosen subtree; the opponent's reply is found in it next time
+        self.root = next((child for child in root.children if child.move == best), None)
+        if self.root is not None:
+            self.root.parent = None
+            cells[best] = player
+            self.root_cells = cells
+            self.shape = shape
+        return divmod(best, cols)
+
+
+mcts_engine = MCTSEngine()
+
+
+def find_best_move_mcts(board, player=2, win_length=WIN_LENGTH, time_budget=AI_TIME_BUDGET, playouts=None,
+                        workers=1):
+
+    return mcts_engine.best_move(board, player, win_length, time_budget, playouts, workers)
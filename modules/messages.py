@@ -1,28 +1,24 @@
 import random
 import sys
+import pygame
 from pythonProject.modules.constants import *
-from pythonProject.modules.game_logic import clear_screen
+from pythonProject.modules.display import get_screen, get_font
+from pythonProject.modules.draw import clear_screen
+from pythonProject.modules.event_loop import wait_events
+from pythonProject.modules.instrumentation import timed
 from pythonProject.modules.roasts import roasts
+from pythonProject.modules.text_cache import text_cache
+from pythonProject.modules.text_wrap import wrap_text
+from pythonProject.modules.widgets import draw_button, striped_text_surface
 from pythonProject.models.GameState import GameState
 
+_game_over_layout = None
 
-def display_message(message, font, color, max_width, padding=20):
-
-    words = message.split(' ')
-    lines = []
-    current_line = ""
 
-    for word in words:
-        test_line = f"{current_line} {word}".strip()
-        test_surface = font.render(test_line, True, color)
-        if test_surface.get_width() <= max_width - 2 * padding:
-            current_line = test_line
-        else:
-            lines.append(current_line)
-            current_line = word
+@timed('render.display_message')
+def display_message(message, font, color, max_width, padding=20):
 
-    if current_line:
-        lines.append(current_line)
+    lines = wrap_text(message, font, max_width - 2 * padding)
 
     text_height = font.get_height() * len(lines)
     text_surface = pygame.Surface((max_width, text_height + 2 * padding), pygame.SRCALPHA)
@@ -30,7 +26,7 @@ def display_message(message, font, color, max_width, padding=20):
 
     y_offset = padding
     for line in lines:
-        line_surface = font.render(line, True, color)
+        line_surface = text_cache.render(line, font, color)
         line_x = (max_width - line_surface.get_width()) // 2
         text_surface.blit(line_surface, (line_x, y_offset))
         y_offset += font.get_height()
@@ -38,69 +34,67 @@ def display_message(message, font, color, max_width, padding=20):
     text_x = (APP_WIDTH - max_width) // 2
     text_y = (APP_HEIGHT - (text_height + 2 * padding)) // 2
 
-    screen.blit(text_surface, (text_x, text_y))
+    get_screen().blit(text_surface, (text_x, text_y))
     pygame.display.update()
 
 def display_secret_unlocked():
 
     message = "Secret Unlocked In Main Menu"
     color_pattern = [RED, BLUE]
-    max_width = APP_WIDTH - 40
-    padding = 20
 
-    letter_surfaces = []
-    for i, letter in enumerate(message):
-        letter_surface = FONT.render(letter, True, color_pattern[i % 2])
-        letter_surfaces.append(letter_surface)
+    message_surface = striped_text_surface(message, color_pattern)
 
-    total_width = sum([surf.get_width() for surf in letter_surfaces])
+    x_offset = (APP_WIDTH - message_surface.get_width()) // 2
+    y_offset = (APP_HEIGHT - get_font().get_height()) // 2
+    get_screen().blit(message_surface, (x_offset, y_offset))
 
-    x_offset = (APP_WIDTH - total_width) // 2
-    y_offset = (APP_HEIGHT - FONT.get_height()) // 2
+    pygame.display.update()
 
-    for letter_surface in letter_surfaces:
-        screen.blit(letter_surface, (x_offset, y_offset))
-        x_offset += letter_surface.get_width()
 
-    pygame.display.update()
+def game_over_buttons():
 
+    global _game_over_layout
+    if _game_over_layout is None:
+        button_width = APP_WIDTH // 2
+        button_height = APP_HEIGHT // 8
+        spacing = APP_HEIGHT // 16
 
-def game_over_screen(winner, is_computer_win=False):
+        button1 = pygame.Rect(APP_WIDTH // 4, APP_HEIGHT // 2 + APP_HEIGHT // 8, button_width, button_height)
+        button2 = pygame.Rect(APP_WIDTH // 4, APP_HEIGHT // 2 + button_height + 3 * spacing, button_width, button_height)
+        _game_over_layout = (button1, button2)
+    return _game_over_layout
+
+
+def draw_game_over_screen(winner, is_computer_win=False):
 
     clear_screen()
+    font = get_font()
 
     if winner == 'draw':
         if GameState.consecutive_draws >= 5:
             display_secret_unlocked()
         else:
-            display_message("It's a draw!", FONT, WHITE, APP_WIDTH - 40)
+            display_message("It's a draw!", font, WHITE, APP_WIDTH - 40)
     elif is_computer_win:
         roast_message = random.choice(roasts)
-        display_message(roast_message, FONT, WHITE, APP_WIDTH - 40)
+        display_message(roast_message, font, WHITE, APP_WIDTH - 40)
     else:
-        display_message(f"Player {winner} wins!", FONT, WHITE, APP_WIDTH - 40)
+        display_message(f"Player {winner} wins!", font, WHITE, APP_WIDTH - 40)
 
-    button_width = APP_WIDTH // 2
-    button_height = APP_HEIGHT // 8
-    spacing = APP_HEIGHT // 16
+    button1, button2 = game_over_buttons()
+    draw_button(button1, 'Play Again')
+    draw_button(button2, 'Main Menu')
 
-    button1 = pygame.Rect(APP_WIDTH // 4, APP_HEIGHT // 2 + APP_HEIGHT // 8, button_width, button_height)
-    button2 = pygame.Rect(APP_WIDTH // 4, APP_HEIGHT // 2 + button_height + 3 * spacing, button_width, button_height)
-    pygame.draw.rect(screen, WHITE, button1)
-    pygame.draw.rect(screen, WHITE, button2)
+    pygame.display.update()
+    return button1, button2
 
-    play_again_text = FONT.render('Play Again', True, BLACK)
-    main_menu_text = FONT.render('Main Menu', True, BLACK)
 
-    screen.blit(play_again_text, (button1.x + button1.width // 2 - play_again_text.get_width() // 2,
-                                  button1.y + button1.height // 2 - play_again_text.get_height() // 2))
-    screen.blit(main_menu_text, (button2.x + button2.width // 2 - main_menu_text.get_width() // 2,
-                                 button2.y + button2.height // 2 - main_menu_text.get_height() // 2))
+def game_over_screen(winner, is_computer_win=False):
 
-    pygame.display.update()
+    button1, button2 = draw_game_over_screen(winner, is_computer_win)
 
     while True:
-        for event in pygame.event.get():
+        for event in wait_events():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
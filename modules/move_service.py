@@ -0,0 +1,185 @@
+import asyncio
+from collections import OrderedDict
+
+from pythonProject.modules.board_config import *
+from pythonProject.modules.bitboard import Bitboard, CELLS, COLS
+from pythonProject.modules.computer_logic import computer_move
+from pythonProject.modules.move_table import get_table, TABLE_SIZE, NO_MOVE, UNREACHABLE
+
+# Front end for computer_move: identical requests share one answer from an LRU cache, and
+# concurrent async requests are gathered into micro-batches that reach the solver only once.
+MOVE_CACHE_ENTRIES = 65536
+BATCH_WINDOW = 0.002
+MAX_BATCH = 256
+
+
+def request_key(board, player, win_length):
+
+    if isinstance(board, Bitboard):
+        return board.x, board.o, player, win_length
+    if len(board) == 3 and len(board[0]) == 3 and win_length == 3:
+        board = Bitboard.from_rows(board)
+        return board.x, board.o, player, win_length
+    return tuple(tuple(row) for row in board), player, win_length
+
+
+def solve_batch(requests):
+
+    # Module level so a process pool can run a whole batch in one round trip. Only perfect play is
+    # deterministic enough to cache, so the service always asks for the hard level.
+    return [computer_move(board, player, win_length, 'hard') for board, player, win_length in requests]
+
+
+class MoveCache:
+
+    def __init__(self, max_entries=MOVE_CACHE_ENTRIES):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        move = self.entries.get(key)
+        if move is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return move
+
+    def store(self, key, move):
+        self.entries[key] = move
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+class MoveService:
+
+    def __init__(self, executor=None, max_entries=MOVE_CACHE_ENTRIES, batch_window=BATCH_WINDOW,
+                 max_batch=MAX_BATCH):
+        # Async batches run in this executor (the loop's default thread pool when None)
+        self.executor = executor
+        self.cache = MoveCache(max_entries)
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.batches = 0
+        self.requests = 0
+        self.deduplicated = 0
+        self._queued = {}
+        self._waiters = {}
+        self._flush_handle = None
+
+    def warm_from_table(self):
+        # Every reachable 3x3 position with a move left, for the side to move
+        table = get_table()
+        warmed = 0
+        for index in range(TABLE_SIZE):
+            entry = table[index]
+            if entry == UNREACHABLE or entry & 0x0F == NO_MOVE:
+                continue
+            x = o = 0
+            remaining = index
+            for cell in range(CELLS):
+                remaining, digit = divmod(remaining, 3)
+                if digit == 1:
+                    x |= 1 << cell
+                elif digit == 2:
+                    o |= 1 << cell
+            player = 1 if bin(x).count('1') == bin(o).count('1') else 2
+            self.cache.store((x, o, player, 3), divmod(entry & 0x0F, COLS))
+            warmed += 1
+        return warmed
+
+    def get_move(self, board, player=2, win_length=WIN_LENGTH):
+        return self.get_moves([board], player, win_length)[0]
+
+    def get_moves(self, boards, player=2, win_length=WIN_LENGTH):
+        # Synchronous batch: each distinct uncached board is solved once
+        requests = [(board, player, win_length) for board in boards]
+        return self._resolve(requests)
+
+    def _resolve(self, requests):
+        self.requests += len(requests)
+        keys = [request_key(*request) for request in requests]
+        moves = {}
+        missing = {}
+        for key, request in zip(keys, requests):
+            if key in moves or key in missing:
+                self.deduplicated += 1
+                continue
+            move = self.cache.get(key)
+            if move is None:
+                missing[key] = request
+            else:
+                moves[key] = move
+        if missing:
+            self.batches += 1
+            for key, move in zip(missing, solve_batch(list(missing.values()))):
+                self.cache.store(key, move)
+                moves[key] = move
+        return [moves[key] for key in keys]
+
+    async def request_move(self, board, player=2, win_length=WIN_LENGTH):
+        # Requests arriving within batch_window of each other are solved together, and a board
+        # that is already queued or being solved just waits for that answer
+        key = request_key(board, player, win_length)
+        self.requests += 1
+        move = self.cache.get(key)
+        if move is not None:
+            return move
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        waiters = self._waiters.get(key)
+        if waiters is not None:
+            self.deduplicated += 1
+            waiters.append(future)
+            return await future
+
+        self._waiters[key] = [future]
+        self._queued[key] = (board, player, win_length)
+        if len(self._queued) >= self.max_batch:
+            self._start_flush(loop)
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_window, self._start_flush, loop)
+        return await future
+
+    def _start_flush(self, loop):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        queued, self._queued = self._queued, {}
+        if queued:
+            loop.create_task(self._flush(loop, queued))
+
+    async def _flush(self, loop, queued):
+        self.batches += 1
+        try:
+            moves = await loop.run_in_executor(self.executor, solve_batch, list(queued.values()))
+        except Exception as error:
+            for key in queued:
+                for future in self._waiters.pop(key, ()):
+                    if not future.done():
+                        future.set_exception(error)
+            return
+        for key, move in zip(queued, moves):
+            self.cache.store(key, move)
+            for future in self._waiters.pop(key, ()):
+                if not future.done():
+                    future.set_result(move)
+
+    def stats(self):
+        return {
+            'requests': self.requests,
+            'hits': self.cache.hits,
+            'misses': self.cache.misses,
+            'deduplicated': self.deduplicated,
+            'batches': self.batches,
+            'cached': len(self.cache.entries),
+        }
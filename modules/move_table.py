@@ -0,0 +1,104 @@
+import mmap
+import os
+import sys
+
+from pythonProject.modules.bitboard import to_bitboard, BASE3, CELLS, COLS, CELL_BITS, FULL_MASK, WINNING
+from pythonProject.modules.computer_logic import board_hash, solve_root, transposition_table
+from pythonProject.modules.instrumentation import counted
+
+# One byte per base-3 board index: high nibble is the value (0 = X wins, 1 = draw, 2 = O wins),
+# low nibble is the best move for the side to move as row * COLS + col.
+TABLE_SIZE = 3 ** CELLS
+NO_MOVE = 0x0F
+UNREACHABLE = 0xFF
+TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'move_table.bin')
+
+_table = None
+
+
+def side_to_move(board):
+
+    board = to_bitboard(board)
+    return 1 if bin(board.x).count('1') == bin(board.o).count('1') else 2
+
+
+def build_table():
+
+    table = bytearray([UNREACHABLE]) * TABLE_SIZE
+
+    def visit(x, o, player):
+        key = BASE3[x] + 2 * BASE3[o]
+        if table[key] != UNREACHABLE:
+            return
+        if WINNING[x]:
+            table[key] = 0 << 4 | NO_MOVE
+            return
+        if WINNING[o]:
+            table[key] = 2 << 4 | NO_MOVE
+            return
+        if x | o == FULL_MASK:
+            table[key] = 1 << 4 | NO_MOVE
+            return
+
+        move, score = solve_root(x, o, player, transposition_table)
+        table[key] = (score // 10 + 1) << 4 | move
+
+        for bit in CELL_BITS:
+            if not (x | o) & bit:
+                if player == 1:
+                    visit(x | bit, o, 2)
+                else:
+                    visit(x, o | bit, 1)
+
+    visit(0, 0, 1)
+    return table
+
+
+def save_table(table, path=TABLE_PATH):
+
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(table)
+    os.replace(tmp_path, path)
+
+
+def load_table(path=TABLE_PATH):
+
+    # Memory-map the file read-only so every process shares the same pages
+    with open(path, 'rb') as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def get_table():
+
+    global _table
+    if _table is None:
+        try:
+            _table = load_table()
+        except (OSError, ValueError):
+            _table = build_table()
+            try:
+                save_table(_table)
+            except OSError:
+                pass
+    return _table
+
+
+@counted('ai.table_lookups')
+def lookup(board):
+
+    # Returns (move, value) for the side to move, or None for positions not reachable in a real game
+    entry = get_table()[board_hash(board)]
+    if entry == UNREACHABLE:
+        return None
+    move = entry & 0x0F
+    value = (entry >> 4) - 1
+    if move == NO_MOVE:
+        return None, value
+    return divmod(move, COLS), value
+
+
+if __name__ == "__main__":
+    path = sys.argv[1] if len(sys.argv) > 1 else TABLE_PATH
+    save_table(build_table(), path)
+    print(f"Wrote {TABLE_SIZE} entries to {path}")
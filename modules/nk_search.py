@@ -0,0 +1,197 @@
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, wait
+
+from pythonProject.modules.board_config import *
+from pythonProject.modules.instrumentation import counted
+from pythonProject.models.Position import Position
+
+WIN_SCORE = 10 ** 9
+# On wide boards only the most promising candidates are searched at each node
+MAX_BRANCHING = 12
+# Transposition table entry kinds; a bound is stored when the search failed low or high
+EXACT, LOWER, UPPER = 0, 1, 2
+# Shallow nodes are cheaper to search again than to look up
+TABLE_MIN_DEPTH = 2
+# Set from another thread to make running searches give up at their next clock check
+stop_search = threading.Event()
+# Seconds between checks for a stopped search while waiting on worker processes
+STOP_POLL_INTERVAL = 0.01
+
+
+class SearchTimeout(Exception):
+    pass
+
+
+class SearchLimits:
+    __slots__ = ('nodes', 'deadline', 'node_limit')
+
+    def __init__(self, deadline=None, node_limit=None):
+        self.nodes = 0
+        self.deadline = deadline
+        self.node_limit = node_limit
+
+
+def init_search_worker(stop, initializer, initargs):
+
+    # Worker processes can't see the main process's thread event; a process-shared one takes its place
+    global stop_search
+    stop_search = stop
+    if initializer is not None:
+        initializer(*initargs)
+
+
+class WorkerPool:
+    # A spawn process pool kept between searches, so later moves don't pay for process start-up.
+    # Stopping the search in the main process reaches the workers through a shared event.
+    __slots__ = ('executor', 'workers', 'stop')
+
+    def __init__(self):
+        self.executor = None
+        self.workers = 0
+        self.stop = None
+
+    def get(self, workers, initializer=None, initargs=()):
+        if self.executor is None or self.workers != workers:
+            self.shutdown()
+            context = multiprocessing.get_context('spawn')
+            self.stop = context.Event()
+            self.executor = ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                                initializer=init_search_worker,
+                                                initargs=(self.stop, initializer, initargs))
+            self.workers = workers
+        self.stop.clear()
+        return self.executor
+
+    def wait(self, futures):
+        # Waits for the futures, passing a stop on to the workers; returns False if the search was stopped
+        pending = set(futures)
+        while pending:
+            if stop_search.is_set():
+                self.stop.set()
+                for future in pending:
+                    future.cancel()
+                return False
+            _, pending = wait(pending, timeout=STOP_POLL_INTERVAL)
+        return True
+
+    def shutdown(self, cancel_futures=False):
+        if self.executor is not None:
+            self.executor.shutdown(cancel_futures=cancel_futures)
+            self.executor = None
+
+
+def candidate_moves(position, player):
+
+    cells, near = position.cells, position.near
+    moves = [cell for cell in range(len(cells)) if cells[cell] == 0 and near[cell]]
+    if not moves:
+        moves = [cell for cell in range(len(cells)) if cells[cell] == 0]
+        if len(moves) == len(cells):
+            # Empty board: the centre is as good as anything and saves a full search
+            return [len(cells) // 2]
+    moves.sort(key=lambda cell: -position.move_priority(cell, player))
+    return moves[:MAX_BRANCHING]
+
+
+@counted('search.nodes')
+def negamax(position, limits, depth, alpha, beta, player, ply, table=None):
+
+    limits.nodes += 1
+    if limits.node_limit is not None and limits.nodes > limits.node_limit:
+        raise SearchTimeout()
+
+    if position.is_full():
+        return 0
+    if depth == 0:
+        return position.score if player == 2 else -position.score
+
+    # The clock is read at every interior node: each one sorts the candidate moves, which on wide
+    # boards costs far more than the check, so the overrun past the deadline is at most one node
+    if stop_search.is_set() or limits.deadline is not None and time.perf_counter() > limits.deadline:
+        raise SearchTimeout()
+
+    # Only entries of exactly this depth are used, so a hit gives the same result a search would
+    key = None
+    if table is not None and depth >= TABLE_MIN_DEPTH:
+        key = position.key ^ player
+        entry = table.probe(key, depth)
+        if entry is not None:
+            score, flag = entry
+            # Win scores are stored relative to this node, not to the root
+            if score > WIN_SCORE // 2:
+                score -= ply
+            elif score < -WIN_SCORE // 2:
+                score += ply
+            if flag == EXACT or (flag == LOWER and score >= beta) or (flag == UPPER and score <= alpha):
+                return score
+    alpha_before = alpha
+
+    best_score = -WIN_SCORE - 1
+    for cell in candidate_moves(position, player):
+        if position.push(cell, player):
+            score = WIN_SCORE - ply
+        else:
+            score = -negamax(position, limits, depth - 1, -beta, -alpha, 3 - player, ply + 1, table)
+        position.pop()
+        if score > best_score:
+            best_score = score
+            if score > alpha:
+                alpha = score
+                if alpha >= beta:
+                    break
+
+    if key is not None:
+        flag = UPPER if best_score <= alpha_before else LOWER if best_score >= beta else EXACT
+        stored = best_score
+        if stored > WIN_SCORE // 2:
+            stored += ply
+        elif stored < -WIN_SCORE // 2:
+            stored -= ply
+        table.store(key, depth, stored, flag)
+    return best_score
+
+
+def find_best_move_nk(board, player=2, win_length=WIN_LENGTH, time_budget=AI_TIME_BUDGET, max_depth=None,
+                      node_budget=None):
+
+    # Iterative deepening: each completed depth refines the answer, and when the time budget
+    # (or node budget) runs out mid-iteration the move from the last completed depth is played.
+    # The search runs on its own copy of the position, so a timeout can abandon it mid-line.
+    # The budget counts from the call, so building the position is part of it.
+    started = time.perf_counter()
+    position = Position.from_board(board, win_length)
+    empty = len(position.cells) - position.move_count
+    if empty == 0:
+        return None
+    if max_depth is None:
+        max_depth = empty
+    limits = SearchLimits(None if time_budget is None else started + time_budget, node_budget)
+
+    root_moves = candidate_moves(position, player)
+    best_cell = root_moves[0]
+    for depth in range(1, max_depth + 1):
+        try:
+            alpha = -WIN_SCORE - 1
+            iteration_best = None
+            for cell in root_moves:
+                if position.push(cell, player):
+                    score = WIN_SCORE
+                else:
+                    score = -negamax(position, limits, depth - 1, -WIN_SCORE - 1, -alpha, 3 - player, 1)
+                position.pop()
+                if score > alpha:
+                    alpha = score
+                    iteration_best = cell
+        except SearchTimeout:
+            break
+
+        best_cell = iteration_best
+        # Search the best move first next time, it makes the deeper cut-offs much cheaper
+        root_moves.remove(best_cell)
+        root_moves.insert(0, best_cell)
+        if alpha >= WIN_SCORE - depth or alpha <= -WIN_SCORE + depth:
+            break
+
+    return divmod(best_cell, position.cols)
@@ -0,0 +1,142 @@
+import atexit
+import time
+from multiprocessing.shared_memory import SharedMemory
+
+from pythonProject.modules.board_config import *
+from pythonProject.modules.nk_search import WIN_SCORE, SearchLimits, SearchTimeout, WorkerPool, candidate_moves, \
+    negamax
+from pythonProject.models.Position import Position
+
+# Root-split search for large boards: every root move of an iteration is searched by a worker
+# process with a full window, so each move gets its exact score whichever worker finishes first.
+# The workers share one transposition table in shared memory and the pool is kept between moves.
+TABLE_ENTRIES = 1 << 20
+SCORE_OFFSET = 1 << 46
+
+_pool = WorkerPool()
+_table = None
+_table_shape = None
+worker_table = None
+
+
+class SharedTable:
+    # Lockless: each entry is two 64-bit words, key ^ data and data. A reader whose XOR does not
+    # give back its key sees an empty, overwritten or half-written entry and treats it as a miss.
+    __slots__ = ('memory', 'words', 'entries')
+
+    def __init__(self, name=None, entries=TABLE_ENTRIES):
+        if name is None:
+            self.memory = SharedMemory(create=True, size=entries * 16)
+        else:
+            # Spawned workers report to the creator's resource tracker, which unlinks the block once
+            self.memory = SharedMemory(name=name)
+        self.words = self.memory.buf.cast('Q')
+        self.entries = len(self.words) // 2
+
+    @property
+    def name(self):
+        return self.memory.name
+
+    def probe(self, key, depth):
+        index = (key % self.entries) * 2
+        data = self.words[index + 1]
+        if self.words[index] ^ data != key or (data >> 2) & 0x3FFF != depth:
+            return None
+        return (data >> 16) - SCORE_OFFSET, data & 3
+
+    def store(self, key, depth, score, flag):
+        if not -SCORE_OFFSET <= score < SCORE_OFFSET:
+            return
+        data = ((score + SCORE_OFFSET) << 16) | (depth << 2) | flag
+        index = (key % self.entries) * 2
+        self.words[index] = key ^ data
+        self.words[index + 1] = data
+
+    def clear(self):
+        self.memory.buf[:] = bytes(len(self.memory.buf))
+
+    def close(self):
+        self.words.release()
+        self.memory.close()
+
+
+def attach_table(name):
+
+    global worker_table
+    worker_table = SharedTable(name)
+
+
+def search_root_move(rows, win_length, cell, player, depth, deadline):
+
+    # Scores one root move to the given depth, or returns None if the deadline passed first.
+    # The deadline is on the shared monotonic clock and is converted to this process's timer.
+    position = Position.from_board(rows, win_length)
+    if position.push(cell, player):
+        return WIN_SCORE
+    limits = SearchLimits(None if deadline is None else time.perf_counter() + deadline - time.monotonic())
+    try:
+        return -negamax(position, limits, depth - 1, -WIN_SCORE - 1, WIN_SCORE + 1, 3 - player, 1, worker_table)
+    except SearchTimeout:
+        return None
+
+
+def shutdown():
+
+    global _table
+    _pool.shutdown(cancel_futures=True)
+    if _table is not None:
+        _table.close()
+        _table.memory.unlink()
+        _table = None
+
+
+def get_pool(workers, shape):
+
+    # The pool and the table are created once and reused, so later moves skip process start-up
+    # and still find the positions searched for earlier moves
+    global _table, _table_shape
+    if _table is None:
+        _table = SharedTable()
+        atexit.register(shutdown)
+    elif shape != _table_shape:
+        # Keys only depend on the marks, so a different win length must not see the old entries
+        _table.clear()
+    _table_shape = shape
+    return _pool.get(workers, attach_table, (_table.name,))
+
+
+def find_best_move_parallel(board, player=2, win_length=WIN_LENGTH, time_budget=AI_TIME_BUDGET, max_depth=None,
+                            workers=SEARCH_WORKERS):
+
+    # Same iterations, move order and tie-breaks as find_best_move_nk, so a completed depth picks
+    # the same move as the single-process search; only how many depths fit in the time budget
+    # depends on the machine.
+    position = Position.from_board(board, win_length)
+    empty = len(position.cells) - position.move_count
+    if empty == 0:
+        return None
+    if max_depth is None:
+        max_depth = empty
+    deadline = None if time_budget is None else time.monotonic() + time_budget
+    rows = position.to_rows()
+    pool = get_pool(workers, (position.rows, position.cols, win_length))
+
+    root_moves = candidate_moves(position, player)
+    best_cell = root_moves[0]
+    for depth in range(1, max_depth + 1):
+        futures = [pool.submit(search_root_move, rows, win_length, cell, player, depth, deadline)
+                   for cell in root_moves]
+        if not _pool.wait(futures):
+            break
+        scores = [future.result() for future in futures]
+        if None in scores:
+            break
+
+        alpha = max(scores)
+        best_cell = root_moves[scores.index(alpha)]
+        root_moves.remove(best_cell)
+        root_moves.insert(0, best_cell)
+        if alpha >= WIN_SCORE - depth or alpha <= -WIN_SCORE + depth:
+            break
+
+    return divmod(best_cell, position.cols)
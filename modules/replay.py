@@ -0,0 +1,58 @@
+from pythonProject.modules.bitboard import Bitboard, CELL_BITS, COLS
+from pythonProject.modules.game_codec import decode_game, to_cells
+
+
+def replay(game, board=None):
+
+    # Yields (ply, (row, col), player, board) for every move. One board is updated in place,
+    # so callers that keep a position must copy it themselves.
+    cells = decode_game(game) if isinstance(game, int) else to_cells(game)
+    if board is None:
+        board = Bitboard()
+    player = 1
+    for ply, cell in enumerate(cells):
+        if player == 1:
+            board.x |= CELL_BITS[cell]
+        else:
+            board.o |= CELL_BITS[cell]
+        yield ply, divmod(cell, COLS), player, board
+        player = 3 - player
+
+
+def final_position(game):
+
+    board = Bitboard()
+    for _ in replay(game, board):
+        pass
+    return board
+
+
+def game_result(game):
+
+    # 1 or 2 for the winner, 0 for a draw, None if the game was not finished
+    board = Bitboard()
+    for _, _, player, _ in replay(game, board):
+        if board.has_won(player):
+            return player
+    return 0 if board.is_full() else None
+
+
+def replay_on_screen(game, move_delay_ms=500, start_ply=0):
+
+    # Draws the position at start_ply in one pass with draw_figures, then adds one mark per step
+    import pygame
+    from pythonProject.modules.draw import clear_screen, draw_lines, draw_figures, draw_mark, flush_display
+
+    clear_screen()
+    draw_lines()
+    board = Bitboard()
+    for ply, (row, col), player, board in replay(game, board):
+        if ply < start_ply:
+            continue
+        if ply == start_ply:
+            draw_figures(board)
+        else:
+            draw_mark(row, col, player)
+        flush_display()
+        pygame.time.wait(move_delay_ms)
+    return board
@@ -1,49 +1,83 @@
 import sys
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+import pygame
 from pythonProject.modules.constants import *
-from pythonProject.modules.game_logic import clear_screen
+from pythonProject.modules.display import get_screen, get_font
+from pythonProject.modules.draw import clear_screen
+from pythonProject.modules.event_loop import wait_events
 from pythonProject.modules.roasts import roasts
+from pythonProject.modules.text_cache import text_cache
+from pythonProject.modules.text_wrap import wrap_text
+
+
+def wrap_roasts(max_width):
+
+    # Split roast text into lines based on max width
+    return [wrap_text(f"{i + 1}. {roast}", get_font(), max_width) for i, roast in enumerate(roasts)]
+
+
+@lru_cache(maxsize=8)
+def roasts_layout(max_width, line_spacing, roast_spacing):
+
+    # Roast list layout, computed once per width and spacing: the text of every wrapped line and its y offset
+    line_texts = []
+    line_offsets = []
+    y_offset = 0
+    for roast_lines in wrap_roasts(max_width):
+        for line in roast_lines:
+            line_texts.append(line)
+            line_offsets.append(y_offset)
+            y_offset += get_font().get_height() + line_spacing
+        y_offset += roast_spacing
+    return tuple(line_texts), tuple(line_offsets), y_offset
+
+
+def draw_roasts_frame(scroll_y, main_menu_button, padding=20, line_spacing=5, roast_spacing=40):
+
+    line_texts, line_offsets, _ = roasts_layout(APP_WIDTH - 2 * padding, line_spacing, roast_spacing)
+    screen = get_screen()
+    font = get_font()
+    line_height = font.get_height()
+
+    # Clear the screen and draw only the lines inside the window, found by binary search
+    screen.fill(BG_COLOR)
+    top = scroll_y + padding
+    first = bisect_right(line_offsets, -top - line_height)
+    last = bisect_left(line_offsets, APP_HEIGHT - top)
+    for index in range(first, last):
+        screen.blit(text_cache.render(line_texts[index], font, WHITE), (padding, top + line_offsets[index]))
+
+    # Draw the main menu button
+    pygame.draw.rect(screen, (0, 128, 255), main_menu_button)
+    main_menu_text = text_cache.render("Main Menu", font, WHITE)
+    text_rect = main_menu_text.get_rect(center=main_menu_button.center)
+    screen.blit(main_menu_text, text_rect)
+
+    pygame.display.update()
+
 
 def display_all_roasts():
     clear_screen()
 
     scroll_y = 0
     roast_spacing = 40
+    line_spacing = 5
     padding = 20
     max_width = APP_WIDTH - 2 * padding
 
-    roast_surfaces = []
-    for i, roast in enumerate(roasts):
-        roast_text = f"{i + 1}. {roast}"
-        roast_lines = []
-        words = roast_text.split(' ')
-        current_line = ""
-
-        # Split roast text into lines based on max width
-        for word in words:
-            test_line = f"{current_line} {word}".strip()
-            test_surface = FONT.render(test_line, True, WHITE)
-            if test_surface.get_width() <= max_width:
-                current_line = test_line
-            else:
-                if current_line:
-                    roast_lines.append(current_line)
-                current_line = word
-        if current_line:
-            roast_lines.append(current_line)
-
-        roast_surfaces.append(roast_lines)
-
-    # Calculate total height of all roasts
-    total_roast_height = sum(len(lines) * FONT.get_height() for lines in roast_surfaces) + len(roasts) * roast_spacing
-    max_scroll_y = total_roast_height - APP_HEIGHT
+    _, _, total_roast_height = roasts_layout(max_width, line_spacing, roast_spacing)
+    max_scroll_y = max(0, total_roast_height - APP_HEIGHT)
 
     scrolling = True
+    drawn_scroll_y = None
+    scroll_keys_held = False
 
     # Draw the main menu button at the bottom of the screen
     main_menu_button = pygame.Rect(padding, APP_HEIGHT - 60, max_width, 50)
 
     while scrolling:
-        for event in pygame.event.get():
+        for event in wait_events(animating=scroll_keys_held):
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -61,6 +95,7 @@ def display_all_roasts():
 
         # Scroll up or down based on arrow keys
         keys = pygame.key.get_pressed()
+        scroll_keys_held = keys[pygame.K_DOWN] or keys[pygame.K_UP]
         if keys[pygame.K_DOWN]:
             scroll_y -= 5
         if keys[pygame.K_UP]:
@@ -69,22 +104,11 @@ def display_all_roasts():
         # Clamp the scroll position
         scroll_y = max(min(0, scroll_y), -max_scroll_y)
 
-        # Clear the screen and draw content
-        screen.fill(BG_COLOR)
-        y_offset = scroll_y + padding
-        for roast_lines in roast_surfaces:
-            for line in roast_lines:
-                line_surface = FONT.render(line, True, WHITE)
-                screen.blit(line_surface, (padding, y_offset))
-                y_offset += FONT.get_height() + 5
-            y_offset += roast_spacing
-
-        # Draw the main menu button
-        pygame.draw.rect(screen, (0, 128, 255), main_menu_button)
-        main_menu_text = FONT.render("Main Menu", True, WHITE)
-        text_rect = main_menu_text.get_rect(center=main_menu_button.center)
-        screen.blit(main_menu_text, text_rect)
-
-        pygame.display.update()
+        # Only redraw when the scroll position changed
+        if scroll_y == drawn_scroll_y:
+            continue
+        drawn_scroll_y = scroll_y
+
+        draw_roasts_frame(scroll_y, main_menu_button, padding, line_spacing, roast_spacing)
 
     return 'main_menu'
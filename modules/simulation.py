@@ -0,0 +1,119 @@
+import argparse
+import random
+import time
+
+from pythonProject.modules.board_config import *
+from pythonProject.modules.game_logic import check_win_at, check_draw, cell_at, place_mark, new_board
+from pythonProject.modules.computer_logic import computer_move
+from pythonProject.modules.game_codec import GameWriter
+
+# Headless games: nothing here imports pygame, so it runs without a display or fonts.
+
+
+def empty_cells(board, rows, cols):
+
+    return [(row, col) for row in range(rows) for col in range(cols) if cell_at(board, row, col) is None]
+
+
+def ai_strategy(board, player, rng, rows, cols, win_length):
+
+    return computer_move(board, player, win_length)
+
+
+def easy_strategy(board, player, rng, rows, cols, win_length):
+
+    return computer_move(board, player, win_length, 'easy', rng)
+
+
+def medium_strategy(board, player, rng, rows, cols, win_length):
+
+    return computer_move(board, player, win_length, 'medium', rng)
+
+
+def mcts_strategy(board, player, rng, rows, cols, win_length):
+
+    return computer_move(board, player, win_length, backend='mcts')
+
+
+def random_strategy(board, player, rng, rows, cols, win_length):
+
+    return rng.choice(empty_cells(board, rows, cols))
+
+
+STRATEGIES = {
+    'ai': ai_strategy,
+    'easy': easy_strategy,
+    'medium': medium_strategy,
+    'mcts': mcts_strategy,
+    'random': random_strategy,
+}
+
+
+def play_game(x_strategy, o_strategy, rng, rows=BOARD_ROWS, cols=BOARD_COLS, win_length=WIN_LENGTH):
+
+    # Returns the winner (1, 2 or 0 for a draw) and the list of moves played
+    board = new_board(rows, cols, win_length)
+    strategies = (None, x_strategy, o_strategy)
+    moves = []
+    player = 1
+    while True:
+        row, col = strategies[player](board, player, rng, rows, cols, win_length)
+        place_mark(board, row, col, player)
+        moves.append((row, col))
+        if check_win_at(board, row, col, player, win_length):
+            return player, moves
+        if check_draw(board):
+            return 0, moves
+        player = 3 - player
+
+
+def run_batch(games, x_strategy, o_strategy, seed=None, rows=BOARD_ROWS, cols=BOARD_COLS, win_length=WIN_LENGTH,
+              writer=None):
+
+    rng = random.Random(seed)
+    results = [0, 0, 0]  # draws, X wins, O wins
+    start = time.perf_counter()
+    for _ in range(games):
+        winner, moves = play_game(x_strategy, o_strategy, rng, rows, cols, win_length)
+        results[winner] += 1
+        if writer is not None:
+            writer.write(moves)
+    elapsed = time.perf_counter() - start
+    return {
+        'games': games,
+        'x_wins': results[1],
+        'o_wins': results[2],
+        'draws': results[0],
+        'seconds': elapsed,
+        'games_per_second': games / elapsed if elapsed else float('inf'),
+    }
+
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description="Play Tic Tac Toe games without a window.")
+    parser.add_argument('--games', type=int, default=1000)
+    parser.add_argument('--x', choices=sorted(STRATEGIES), default='random', help="strategy for player X")
+    parser.add_argument('--o', choices=sorted(STRATEGIES), default='ai', help="strategy for player O")
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--size', type=int, default=BOARD_ROWS, help="board is size x size")
+    parser.add_argument('--win-length', type=int, default=WIN_LENGTH)
+    parser.add_argument('--record', metavar='PATH', help="append every 3x3 game to a compact game archive")
+    args = parser.parse_args(argv)
+
+    if args.record and not args.size == args.win_length == 3:
+        parser.error("--record only supports the 3x3 game")
+    writer = GameWriter(args.record) if args.record else None
+    try:
+        stats = run_batch(args.games, STRATEGIES[args.x], STRATEGIES[args.o], args.seed,
+                          args.size, args.size, args.win_length, writer)
+    finally:
+        if writer is not None:
+            writer.close()
+    print(f"{stats['games']} games in {stats['seconds']:.2f}s ({stats['games_per_second']:.1f} games/s)")
+    print(f"X ({args.x}) wins: {stats['x_wins']}  O ({args.o}) wins: {stats['o_wins']}  draws: {stats['draws']}")
+    return stats
+
+
+if __name__ == "__main__":
+    main()
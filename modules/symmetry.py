@@ -0,0 +1,87 @@
+from pythonProject.modules.bitboard import Bitboard, to_bitboard, ROWS, COLS, CELLS, CELL_BITS, FULL_MASK
+
+# The 8 symmetries of the square board as (row, col) -> (row, col) maps.
+# Index 0 is the identity, so an already canonical board reports transform 0.
+_SYMMETRIES = (
+    lambda r, c: (r, c),
+    lambda r, c: (c, COLS - 1 - r),                 # rotate 90
+    lambda r, c: (ROWS - 1 - r, COLS - 1 - c),      # rotate 180
+    lambda r, c: (ROWS - 1 - c, r),                 # rotate 270
+    lambda r, c: (r, COLS - 1 - c),                 # mirror left-right
+    lambda r, c: (ROWS - 1 - r, c),                 # mirror top-bottom
+    lambda r, c: (c, r),                            # main diagonal
+    lambda r, c: (ROWS - 1 - c, COLS - 1 - r),      # anti-diagonal
+)
+
+# CELL_MAPS[t][cell] is where transform t sends cell, INVERSE_CELL_MAPS undoes it
+CELL_MAPS = tuple(
+    tuple(row * COLS + col for row, col in (symmetry(*divmod(cell, COLS)) for cell in range(CELLS)))
+    for symmetry in _SYMMETRIES
+)
+INVERSE_CELL_MAPS = tuple(
+    tuple(mapping.index(cell) for cell in range(CELLS))
+    for mapping in CELL_MAPS
+)
+
+# MASK_MAPS[t][mask] applies transform t to a whole 9-bit mask in one lookup
+MASK_MAPS = tuple(
+    tuple(sum(CELL_BITS[mapping[cell]] for cell in range(CELLS) if mask & CELL_BITS[cell]) for mask in range(1 << CELLS))
+    for mapping in CELL_MAPS
+)
+
+
+def canonical_key(x, o):
+
+    # Smallest (x << 9 | o) over all symmetries, shared by every equivalent position
+    best_key = x << CELLS | o
+    for mapping in MASK_MAPS:
+        key = mapping[x] << CELLS | mapping[o]
+        if key < best_key:
+            best_key = key
+    return best_key
+
+
+def canonicalize(board):
+
+    # Returns the canonical board and the transform that maps the given board onto it
+    board = to_bitboard(board)
+    best_key = None
+    best_transform = 0
+    for transform, mapping in enumerate(MASK_MAPS):
+        key = mapping[board.x] << CELLS | mapping[board.o]
+        if best_key is None or key < best_key:
+            best_key = key
+            best_transform = transform
+    return Bitboard(best_key >> CELLS, best_key & FULL_MASK), best_transform
+
+
+def transform_move(move, transform):
+
+    row, col = move
+    return divmod(CELL_MAPS[transform][row * COLS + col], COLS)
+
+
+def restore_move(move, transform):
+
+    # Maps a move chosen on the canonical board back onto the original board
+    row, col = move
+    return divmod(INVERSE_CELL_MAPS[transform][row * COLS + col], COLS)
+
+
+def stabilizer(x, o):
+
+    # Transforms that leave the position unchanged; moves they map onto each other are equivalent
+    return [transform for transform, mapping in enumerate(MASK_MAPS) if mapping[x] == x and mapping[o] == o]
+
+
+def unique_moves(x, o):
+
+    # Empty cells with one representative per equivalence class, the first in row-major order
+    occupied = x | o
+    transforms = stabilizer(x, o)
+    moves = []
+    for cell in range(CELLS):
+        if not occupied & CELL_BITS[cell]:
+            if all(CELL_MAPS[transform][cell] >= cell for transform in transforms):
+                moves.append(cell)
+    return moves
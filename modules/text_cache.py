@@ -0,0 +1,40 @@
+from collections import OrderedDict
+
+# Rendered text surfaces are kept until this many bytes of pixel data are cached
+TEXT_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+
+class TextSurfaceCache:
+
+    def __init__(self, max_bytes=TEXT_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.used_bytes = 0
+        self.surfaces = OrderedDict()
+
+    def render(self, text, font, color):
+        # Least recently used surfaces are dropped first once the byte budget is exceeded
+        key = (text, font, color)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            return surface
+
+        surface = font.render(text, True, color)
+        self.surfaces[key] = surface
+        self.used_bytes += surface_bytes(surface)
+        while self.used_bytes > self.max_bytes and len(self.surfaces) > 1:
+            _, evicted = self.surfaces.popitem(last=False)
+            self.used_bytes -= surface_bytes(evicted)
+        return surface
+
+    def clear(self):
+        self.surfaces.clear()
+        self.used_bytes = 0
+
+
+def surface_bytes(surface):
+
+    return surface.get_pitch() * surface.get_height()
+
+
+text_cache = TextSurfaceCache()
@@ -0,0 +1,26 @@
+from functools import lru_cache
+
+# Word wrapping from glyph metrics: Font.size measures text without rasterizing it, and the
+# wrapped lines are cached per text, font and width.
+
+
+@lru_cache(maxsize=1024)
+def wrap_text(text, font, max_width):
+
+    lines = []
+    line = ''
+    for word in text.split():
+        if not line:
+            line = word
+            continue
+        # Each candidate line is measured whole; summing word widths drifts with kerning
+        candidate = f"{line} {word}"
+        if font.size(candidate)[0] > max_width:
+            lines.append(line)
+            line = word
+        else:
+            line = candidate
+
+    if line:
+        lines.append(line)
+    return tuple(lines)
@@ -0,0 +1,125 @@
+import argparse
+import os
+import random
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+from pythonProject.modules.board_config import *
+from pythonProject.modules.move_table import get_table
+from pythonProject.modules.simulation import STRATEGIES, play_game
+
+DEFAULT_CHUNK_SIZE = 2000
+# Chunks queued per worker, enough to keep every core busy without holding millions of futures
+CHUNKS_IN_FLIGHT_PER_WORKER = 4
+
+
+def uses_move_table(rows, cols, win_length):
+
+    return rows == cols == win_length == 3
+
+
+def init_worker(rows, cols, win_length):
+
+    # Each worker maps the same read-only table file, so the OS shares its pages between them;
+    # other board shapes never look moves up in it
+    if uses_move_table(rows, cols, win_length):
+        get_table()
+
+
+def play_chunk(chunk_index, games, x_name, o_name, seed, rows, cols, win_length):
+
+    # Per-game results travel back as compact arrays: a winner byte and a 16-bit move count,
+    # wide enough for every board size the runner accepts
+    rng = random.Random(None if seed is None else seed * 1000003 + chunk_index)
+    x_strategy, o_strategy = STRATEGIES[x_name], STRATEGIES[o_name]
+    winners = bytearray(games)
+    lengths = array('H', bytes(2 * games))
+    for game in range(games):
+        winner, moves = play_game(x_strategy, o_strategy, rng, rows, cols, win_length)
+        winners[game] = winner
+        lengths[game] = len(moves)
+    return chunk_index, bytes(winners), lengths
+
+
+class TournamentStats:
+
+    def __init__(self):
+        self.games = 0
+        self.results = [0, 0, 0]  # draws, X wins, O wins
+        self.total_moves = 0
+
+    def add_chunk(self, winners, lengths):
+        self.games += len(winners)
+        for winner in (0, 1, 2):
+            self.results[winner] += winners.count(winner)
+        self.total_moves += sum(lengths)
+
+    def as_dict(self):
+        return {
+            'games': self.games,
+            'x_wins': self.results[1],
+            'o_wins': self.results[2],
+            'draws': self.results[0],
+            'average_moves': self.total_moves / self.games if self.games else 0,
+        }
+
+
+def run_tournament(games, x_name='random', o_name='ai', workers=None, chunk_size=DEFAULT_CHUNK_SIZE, seed=None,
+                   rows=BOARD_ROWS, cols=BOARD_COLS, win_length=WIN_LENGTH, on_chunk=None):
+
+    workers = workers or os.cpu_count() or 1
+    # Build the table file once up front instead of racing to build it in every worker
+    if uses_move_table(rows, cols, win_length):
+        get_table()
+
+    stats = TournamentStats()
+    chunk_sizes = [min(chunk_size, games - start) for start in range(0, games, chunk_size)]
+    start_time = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                             initargs=(rows, cols, win_length)) as executor:
+        pending = set()
+        next_chunk = 0
+        while next_chunk < len(chunk_sizes) or pending:
+            while next_chunk < len(chunk_sizes) and len(pending) < workers * CHUNKS_IN_FLIGHT_PER_WORKER:
+                pending.add(executor.submit(play_chunk, next_chunk, chunk_sizes[next_chunk], x_name, o_name,
+                                            seed, rows, cols, win_length))
+                next_chunk += 1
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                chunk_index, winners, lengths = future.result()
+                stats.add_chunk(winners, lengths)
+                if on_chunk is not None:
+                    on_chunk(chunk_index, winners, lengths)
+
+    result = stats.as_dict()
+    result['workers'] = workers
+    result['seconds'] = time.perf_counter() - start_time
+    result['games_per_second'] = games / result['seconds'] if result['seconds'] else float('inf')
+    return result
+
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description="Play many headless games across all CPU cores.")
+    parser.add_argument('--games', type=int, default=100000)
+    parser.add_argument('--x', choices=sorted(STRATEGIES), default='random', help="strategy for player X")
+    parser.add_argument('--o', choices=sorted(STRATEGIES), default='ai', help="strategy for player O")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: one per core)")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--size', type=int, default=BOARD_ROWS, help="board is size x size")
+    parser.add_argument('--win-length', type=int, default=WIN_LENGTH)
+    args = parser.parse_args(argv)
+
+    stats = run_tournament(args.games, args.x, args.o, args.workers, args.chunk_size, args.seed,
+                           args.size, args.size, args.win_length)
+    print(f"{stats['games']} games on {stats['workers']} workers in {stats['seconds']:.2f}s "
+          f"({stats['games_per_second']:.1f} games/s)")
+    print(f"X ({args.x}) wins: {stats['x_wins']}  O ({args.o}) wins: {stats['o_wins']}  "
+          f"draws: {stats['draws']}  average moves: {stats['average_moves']:.2f}")
+    return stats
+
+
+if __name__ == "__main__":
+    main()
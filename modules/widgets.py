@@ -0,0 +1,64 @@
+import pygame
+
+from pythonProject.modules.constants import *
+from pythonProject.modules.display import get_screen, get_font
+from pythonProject.modules.text_cache import text_cache
+
+# Pre-rendered button surfaces keyed by (text, size, colors, font). Reopening a screen
+# blits these instead of drawing rects, rendering labels and recomputing the centering.
+_button_surfaces = {}
+_composites = {}
+
+
+def label_surface(text, color=BLACK, font=None):
+
+    if font is None:
+        font = get_font()
+    return text_cache.render(text, font, color)
+
+
+def button_surface(text, size, color=WHITE, text_color=BLACK, font=None):
+
+    if font is None:
+        font = get_font()
+    key = (text, size, color, text_color, font)
+    surface = _button_surfaces.get(key)
+    if surface is None:
+        surface = pygame.Surface(size)
+        surface.fill(color)
+        label = label_surface(text, text_color, font)
+        # Center the text on the button
+        surface.blit(label, (size[0] // 2 - label.get_width() // 2, size[1] // 2 - label.get_height() // 2))
+        _button_surfaces[key] = surface
+    return surface
+
+
+def draw_button(rect, text, color=WHITE, text_color=BLACK, font=None):
+
+    return get_screen().blit(button_surface(text, rect.size, color, text_color, font), rect.topleft)
+
+
+def striped_text_surface(text, colors, font=None):
+
+    # Text whose letters cycle through colors, composed once into a single surface
+    if font is None:
+        font = get_font()
+    key = (text, tuple(colors), font)
+    surface = _composites.get(key)
+    if surface is None:
+        letter_surfaces = [label_surface(letter, colors[i % len(colors)], font) for i, letter in enumerate(text)]
+        surface = pygame.Surface((sum(letter.get_width() for letter in letter_surfaces), font.get_height()),
+                                 pygame.SRCALPHA)
+        x_offset = 0
+        for letter in letter_surfaces:
+            surface.blit(letter, (x_offset, 0))
+            x_offset += letter.get_width()
+        _composites[key] = surface
+    return surface
+
+
+def clear_widget_cache():
+
+    _button_surfaces.clear()
+    _composites.clear()
+    text_cache.clear()
@@ -1,22 +1,27 @@
-from pythonProject.modules.draw import draw_lines, draw_figures
-from pythonProject.modules.game_logic import check_win, check_draw, reset_board
+import sqlite3
+import time
+
+from pythonProject.modules.draw import draw_lines, draw_mark, flush_display, mark_dirty, draw_thinking_indicator
+from pythonProject.modules.game_logic import reset_board
 from pythonProject.modules.menu import main_menu
 from pythonProject.modules.messages import *
-from pythonProject.modules.computer_logic import computer_move
+from pythonProject.modules.ai_worker import AIWorker
 from pythonProject.modules.roasts_logic import display_all_roasts
+from pythonProject.modules.event_loop import wait_events
+from pythonProject.modules.display import get_screen, get_font
+from pythonProject.modules.match_history import MatchHistory
 
 
 def display_scores(score_x, score_o):
     # Define the score display area
-    score_text_x = FONT.render(f"Score X: {score_x}", True, WHITE)
-    score_text_o = FONT.render(f"Score O: {score_o}", True, WHITE)
-
-    # Position the score text
-    screen.blit(score_text_x, (10, 10))
-    screen.blit(score_text_o, (APP_WIDTH - score_text_o.get_width() - 10, 10))
+    screen = get_screen()
+    font = get_font()
+    score_text_x = font.render(f"Score X: {score_x}", True, WHITE)
+    score_text_o = font.render(f"Score O: {score_o}", True, WHITE)
 
-    # Update the display with the score
-    pygame.display.update()
+    # Position the score text and mark only those areas for the next display update
+    mark_dirty(screen.blit(score_text_x, (10, 10)))
+    mark_dirty(screen.blit(score_text_o, (APP_WIDTH - score_text_o.get_width() - 10, 10)))
 
 
 def handle_game_over_choice(choice):
@@ -25,10 +30,20 @@ def handle_game_over_choice(choice):
     elif choice == 'main_menu':
         return False, None
 
+def open_history():
+    # The game still runs without history if the database can't be opened
+    try:
+        return MatchHistory()
+    except sqlite3.Error:
+        return None
+
+
 def main():
     score_x = 0
     score_o = 0
-    GameState.consecutive_draws = 0
+    history = open_history()
+    ai = AIWorker()
+    GameState.consecutive_draws = history.draw_streak()[0] if history else 0
 
     mode = None  # Start with no specific mode
 
@@ -37,34 +52,52 @@ def main():
         if mode is None:
             mode = main_menu()
 
-        # Prepare the game for a new round
+        # Prepare the game for a new round; the position keeps the moves, winner and move count
         board = reset_board()
         clear_screen()
         draw_lines()
-        pygame.display.update()
+        if mode == 'player':
+            display_scores(score_x, score_o)
+        flush_display()
 
         game_over = False
         current_player = 1
         winner = None
-
-        while not game_over:
-            for event in pygame.event.get():
+        is_computer_win = False
+        thinking = False
+        abandoned = False
+        started_at = last_move_at = time.time()
+
+        while not game_over and not abandoned:
+            # The computer searches on the AI thread; its finished move wakes this wait
+            for event in wait_events():
                 if event.type == pygame.QUIT:
+                    ai.cancel()
                     pygame.quit()
                     sys.exit()
 
-                if event.type == pygame.MOUSEBUTTONDOWN and not game_over:
+                # Escape while the computer thinks abandons the game and returns to the main menu
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE and thinking:
+                    ai.cancel()
+                    thinking = False
+                    abandoned = True
+
+                # Clicks are ignored on the computer's turn
+                if event.type == pygame.MOUSEBUTTONDOWN and not game_over and not abandoned and not (
+                        mode == 'computer' and current_player == 2):
                     mouseX, mouseY = event.pos
 
                     if OFFSET_X <= mouseX <= OFFSET_X + GAME_WIDTH and OFFSET_Y <= mouseY <= OFFSET_Y + GAME_HEIGHT:
-                        clicked_row = (mouseY - OFFSET_Y) // SQUARE_SIZE
-                        clicked_col = (mouseX - OFFSET_X) // SQUARE_SIZE
+                        clicked_row = min((mouseY - OFFSET_Y) // SQUARE_SIZE, BOARD_ROWS - 1)
+                        clicked_col = min((mouseX - OFFSET_X) // SQUARE_SIZE, BOARD_COLS - 1)
 
-                        if board[clicked_row][clicked_col] is None:
-                            board[clicked_row][clicked_col] = current_player
-                            draw_figures(board)
+                        if board.get(clicked_row, clicked_col) is None:
+                            board.push_at(clicked_row, clicked_col, current_player)
+                            last_move_at = time.time()
+                            draw_mark(clicked_row, clicked_col, current_player)
+                            flush_display()
 
-                            if check_win(board, current_player):
+                            if board.winner == current_player:
                                 game_over = True
                                 winner = 'X' if current_player == 1 else 'O'
                                 is_computer_win = (mode == 'computer' and winner == 'O')
@@ -72,38 +105,53 @@ def main():
                                     score_x += 1
                                 else:
                                     score_o += 1
-                                choice = game_over_screen(winner, is_computer_win=is_computer_win)
 
-                            elif check_draw(board):
+                            elif board.is_full():
                                 game_over = True
                                 winner = 'draw'
                                 GameState.consecutive_draws += 1
-                                choice = game_over_screen(winner)
 
                             current_player = 3 - current_player
 
-            if mode == 'computer' and current_player == 2 and not game_over:
-                row, col = computer_move(board)
-                board[row][col] = current_player
-                draw_figures(board)
-
-                if check_win(board, current_player):
+            if mode == 'computer' and current_player == 2 and not game_over and not thinking and not abandoned:
+                ai.request_move(board)
+                thinking = True
+                draw_thinking_indicator(True)
+
+            move = ai.poll() if thinking else None
+            if move is not None:
+                row, col = move
+                thinking = False
+                draw_thinking_indicator(False)
+                board.push_at(row, col, current_player)
+                last_move_at = time.time()
+                draw_mark(row, col, current_player)
+
+                if board.winner == current_player:
                     game_over = True
                     winner = 'O'
-                    choice = game_over_screen(winner, is_computer_win=True)
+                    is_computer_win = True
                     GameState.consecutive_draws = 0
-                elif check_draw(board):
+                elif board.is_full():
                     game_over = True
                     winner = 'draw'
                     GameState.consecutive_draws += 1
-                    choice = game_over_screen(winner)
 
                 current_player = 1
+                ai.think_ahead(board)
 
-            if mode == 'player':
-                display_scores(score_x, score_o)
+            flush_display()
+
+        if abandoned:
+            mode = None
+            continue
 
-            pygame.display.update()
+        # Record the game before the game over screen, so it is kept even if the window is closed there
+        if history is not None:
+            history.record_game(mode, {'X': 1, 'O': 2, 'draw': 0}[winner], board.move_list(), started_at,
+                                last_move_at - started_at, 'Player X',
+                                'Computer' if mode == 'computer' else 'Player O')
+        choice = game_over_screen(winner, is_computer_win=is_computer_win)
 
         # Handle game over state
         game_over_response = handle_game_over_choice(choice)